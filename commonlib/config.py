@@ -16,9 +16,24 @@ Design Notes
 ------------
 * The decorator mutates the target class by injecting helper methods.
 * It uses UTF-8 for reading and writing files.
-* All I/O is synchronous; no concurrency controls are provided.
+* JSON goes through ``orjson`` when it is installed and falls back to the
+  standard library ``json`` module otherwise.
+* YAML uses the libyaml-backed ``CSafeLoader``/``CSafeDumper`` when PyYAML
+  was built with them; TOML is read with ``tomllib`` on Python 3.11+.
+* All I/O is synchronous; no concurrency controls are provided. Writes go
+  to a temporary sibling file that atomically replaces the target.
+* File contents are cached per path and reused while the file's
+  ``st_mtime_ns`` and ``st_size`` are unchanged; writes drop the entry.
+  JSON is re-parsed from the cached bytes, other formats deep-copy a
+  cached parsed dict.
 * Error messages are collected in ``self._error`` and surfaced via the
   ``error`` property.
+* Instances keep their ``__dict__``: config attributes are class attributes
+  with per-instance overrides, which slots cannot express. A ``__slots__``
+  class must therefore list ``"__dict__"`` in its ``__slots__`` (which also
+  holds the injected ``_error``/``_is_available`` state); one without it is
+  rejected with ``TypeError`` at decoration time. Slot descriptors are never
+  treated as config attributes.
 * Domain/business logic should NOT be implemented here; this is an infra/utility
   component meant to be consumed by application/domain layers.
 
@@ -37,14 +52,46 @@ Example
 from __future__ import annotations
 
 import configparser
+import copy
+import io
 import json
+import os
+import types
+from contextlib import contextmanager
 from enum import Enum
 from pathlib import Path
-from typing import Any, Dict, List, Optional, Union
+from typing import (
+    Any,
+    BinaryIO,
+    Callable,
+    Dict,
+    Iterator,
+    List,
+    Optional,
+    Tuple,
+    Union,
+)
 
 import toml
 import yaml
 
+try:
+    import orjson
+except ImportError:  # optional accelerator
+    orjson = None
+
+try:
+    import tomllib
+except ImportError:  # Python < 3.11
+    tomllib = None
+
+try:
+    from yaml import CSafeDumper as _YamlDumper
+    from yaml import CSafeLoader as _YamlLoader
+except ImportError:  # PyYAML built without libyaml
+    from yaml import SafeDumper as _YamlDumper
+    from yaml import SafeLoader as _YamlLoader
+
 
 class ConfigType(Enum):
     """Supported configuration formats."""
@@ -55,6 +102,413 @@ class ConfigType(Enum):
     JSON = "json"
 
 
+# File suffix -> configuration format
+_SUFFIX_MAP: Dict[str, ConfigType] = {
+    ".json": ConfigType.JSON,
+    ".toml": ConfigType.TOML,
+    ".yaml": ConfigType.YAML,
+    ".yml": ConfigType.YAML,
+    ".ini": ConfigType.INI,
+    ".cfg": ConfigType.INI,
+    ".conf": ConfigType.INI,
+}
+
+# Injected properties that must never be treated as config values
+_SKIP_ATTRS = frozenset({"error", "is_available"})
+
+# Config contents keyed by path: (st_mtime_ns, st_size, raw bytes, parsed
+# dict). Formats outside ``_REPARSE_ON_HIT`` fill the dict on the first cache
+# hit, see ``_read_config_file``.
+_PARSE_CACHE: Dict[Path, Tuple[int, int, bytes, Optional[Dict[str, Any]]]] = {}
+
+# Formats that re-parse the cached bytes on a hit: parsing JSON is cheaper
+# than deep-copying the parsed dict, unlike YAML/TOML/INI
+_REPARSE_ON_HIT = frozenset({ConfigType.JSON})
+
+
+def _read_json(buf: bytes) -> Dict[str, Any]:
+    """Parse JSON config bytes."""
+    if orjson is not None:
+        return orjson.loads(buf)
+    return json.loads(buf)
+
+
+def _read_toml(buf: bytes) -> Dict[str, Any]:
+    """Parse TOML config bytes."""
+    if tomllib is not None:
+        return tomllib.loads(buf.decode("utf-8"))
+    return toml.loads(buf.decode("utf-8"))
+
+
+def _read_yaml(buf: bytes) -> Dict[str, Any]:
+    """Parse YAML config bytes."""
+    return yaml.load(buf, Loader=_YamlLoader)
+
+
+def _read_ini(buf: bytes) -> Dict[str, Any]:
+    """Parse INI config bytes into ``{section: {key: value}}``.
+
+    If no named sections exist, the DEFAULT section is returned flat.
+    Values are taken verbatim; ``%`` interpolation is disabled.
+    """
+    parser = configparser.ConfigParser(interpolation=None)
+    parser.read_string(buf.decode("utf-8"))
+    result: Dict[str, Any] = {
+        section: dict(parser.items(section, raw=True))
+        for section in parser.sections()
+    }
+    if not result and parser.defaults():
+        result = dict(parser.defaults())
+    return result
+
+
+def _dump_json(data: Dict[str, Any], fp: BinaryIO) -> None:
+    """Write ``data`` to ``fp`` as indented UTF-8 JSON."""
+    if orjson is not None:
+        option = orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS
+        fp.write(orjson.dumps(data, option=option))
+    else:
+        fp.write(json.dumps(data, ensure_ascii=False, indent=2).encode("utf-8"))
+
+
+def _dump_toml(data: Dict[str, Any], fp: BinaryIO) -> None:
+    """Write ``data`` to ``fp`` as TOML."""
+    fp.write(toml.dumps(data).encode("utf-8"))
+
+
+def _dump_yaml(data: Dict[str, Any], fp: BinaryIO) -> None:
+    """Stream ``data`` to ``fp`` as block-style UTF-8 YAML."""
+    yaml.dump(
+        data,
+        fp,
+        Dumper=_YamlDumper,
+        default_flow_style=False,
+        allow_unicode=True,
+        encoding="utf-8",
+    )
+
+
+def _dump_ini(data: Dict[str, Any], fp: BinaryIO) -> None:
+    """Write ``data`` to ``fp`` as INI.
+
+    Nested dicts become sections; scalars go to DEFAULT.
+    """
+    parser = configparser.ConfigParser(interpolation=None)
+
+    default_section: Dict[str, str] = {}
+    sections: Dict[str, Dict[str, str]] = {}
+
+    for key, value in data.items():
+        if isinstance(value, dict):
+            sections[key] = {k: str(v) for k, v in value.items()}
+        else:
+            default_section[key] = str(value)
+
+    if default_section:
+        parser["DEFAULT"] = default_section
+
+    for section_name, section_data in sections.items():
+        parser[section_name] = section_data
+
+    text = io.TextIOWrapper(fp, encoding="utf-8", newline="")
+    parser.write(text)
+    # Flush into fp without closing it
+    text.detach()
+
+
+# Failures reported through ``error``/``is_available`` rather than raised.
+# JSON/TOML decode errors and UnicodeDecodeError are ValueError subclasses.
+_READ_ERRORS = (OSError, ValueError, yaml.YAMLError, configparser.Error)
+_WRITE_ERRORS = (OSError, TypeError, ValueError, yaml.YAMLError, configparser.Error)
+
+# Format dispatch tables; unknown types read as an empty config
+_READERS: Dict[ConfigType, Callable[[bytes], Dict[str, Any]]] = {
+    ConfigType.JSON: _read_json,
+    ConfigType.TOML: _read_toml,
+    ConfigType.YAML: _read_yaml,
+    ConfigType.INI: _read_ini,
+}
+
+_DUMPERS: Dict[ConfigType, Callable[[Dict[str, Any], BinaryIO], None]] = {
+    ConfigType.JSON: _dump_json,
+    ConfigType.TOML: _dump_toml,
+    ConfigType.YAML: _dump_yaml,
+    ConfigType.INI: _dump_ini,
+}
+
+
+def _serialize(
+    config_type: Optional[ConfigType], data: Dict[str, Any]
+) -> Optional[bytes]:
+    """Serialize ``data`` in memory; returns ``None`` for unknown types."""
+    dumper = _DUMPERS.get(config_type)
+    if dumper is None:
+        return None
+    buf = io.BytesIO()
+    dumper(data, buf)
+    return buf.getvalue()
+
+
+@contextmanager
+def _open_for_write(config_path: Path) -> Iterator[BinaryIO]:
+    """Atomically rewrite ``config_path``, creating its parent if needed.
+
+    Content goes to a sibling ``<name>.tmp`` file that replaces the target
+    via ``os.replace`` only after the dump succeeded, so a crash mid-write
+    never leaves a truncated config behind. The parent directory is only
+    created when the first ``open`` reports it missing, so repeated saves
+    do not pay for a ``mkdir`` each time.
+
+    Args:
+        config_path: Destination path.
+
+    Yields:
+        A binary file handle; dumpers write straight into it so no
+        intermediate ``str`` of the whole document is built.
+    """
+    # A rewrite may keep the same mtime/size; never serve stale data
+    _PARSE_CACHE.pop(config_path, None)
+
+    tmp_path = config_path.with_name(config_path.name + ".tmp")
+    try:
+        f = open(tmp_path, "wb")
+    except FileNotFoundError:
+        config_path.parent.mkdir(parents=True, exist_ok=True)
+        f = open(tmp_path, "wb")
+
+    try:
+        with f:
+            yield f
+        os.replace(tmp_path, config_path)
+    except BaseException:
+        tmp_path.unlink(missing_ok=True)
+        raise
+
+
+# Methods injected into decorated classes by ``Config.__call__``. They are
+# defined once here so every decorated class shares the same code objects.
+
+
+def _detect_config_type(cls, file_path: Path) -> ConfigType:
+    """Detect configuration type from file suffix (class-level).
+
+    Args:
+        cls: The decorated class (unused, present for ``classmethod`` binding).
+        file_path: The target config file path.
+
+    Returns:
+        The detected :class:`ConfigType`. Defaults to JSON if unknown.
+    """
+    return _SUFFIX_MAP.get(file_path.suffix.lower(), ConfigType.JSON)
+
+
+def _load_config(self) -> None:
+    """Load configuration from the configured file.
+
+    Behavior:
+        * If the config file is present, reads values and sets instance
+          attributes for public class attributes found in the file.
+        * If the config file does not exist, creates it from the class
+          defaults.
+        * Non-fatal errors are collected in ``self._error``.
+
+    Side Effects:
+        Updates ``self._is_available`` on failure.
+    """
+    cls = self.__class__
+    config_path = cls._config_path
+    if not config_path:
+        self._error.append("Config file path is not specified.")
+        self._is_available = False
+        return
+
+    try:
+        # Read config file (the stat inside doubles as existence check)
+        data = self._read_config_file(config_path)
+
+        # Populate instance attributes from data
+        for attr_name in cls._config_attrs:
+            if attr_name in data:
+                setattr(self, attr_name, data[attr_name])
+            elif isinstance(getattr(cls, attr_name), (list, dict)):
+                # If missing, set to None for list/dict defaults
+                setattr(self, attr_name, None)
+
+    except FileNotFoundError:
+        # Create a new config file seeded with class defaults
+        self._create_config_file()
+
+    except OSError as e:
+        self._error.append(f"Error while loading config file: {str(e)}")
+        self._is_available = False
+
+
+def _parse_config(
+    reader: Optional[Callable[[bytes], Dict[str, Any]]], buf: bytes
+) -> Dict[str, Any]:
+    """Parse config bytes with ``reader``; unknown formats read as ``{}``.
+
+    Raises:
+        ValueError: If the document is not a mapping at top level.
+    """
+    data = reader(buf) if reader else {}
+    if not isinstance(data, dict):
+        raise ValueError(
+            f"expected a mapping at top level, got {type(data).__name__}"
+        )
+    return data
+
+
+def _read_config_file(self, config_path: Path) -> Dict[str, Any]:
+    """Read configuration file content into a dict.
+
+    Args:
+        config_path: The path to the configuration file.
+
+    Returns:
+        A dictionary of configuration values. On failure, returns an
+        empty dict and records the error.
+
+    Raises:
+        FileNotFoundError: If the file does not exist, so the caller
+            can seed it without a separate existence check.
+
+    Side Effects:
+        Updates ``self._is_available`` on failure and appends messages
+        to ``self._error``.
+    """
+    config_type = self.__class__._config_type
+
+    try:
+        reader = _READERS.get(config_type)
+
+        # Reuse the cached contents while the file is unchanged
+        st = config_path.stat()
+        cached = _PARSE_CACHE.get(config_path)
+        if cached and cached[:2] == (st.st_mtime_ns, st.st_size):
+            if config_type in _REPARSE_ON_HIT:
+                # Fresh objects straight from the bytes, no file I/O
+                return _parse_config(reader, cached[2])
+            data = cached[3]
+            if data is None:
+                # First hit: the cold load handed its dict to the caller, so
+                # parse the cache's own copy from the stored bytes
+                data = _parse_config(reader, cached[2])
+                _PARSE_CACHE[config_path] = (*cached[:3], data)
+            return copy.deepcopy(data)
+
+        # Read once and parse from memory; the caller owns the result
+        buf = config_path.read_bytes()
+        data = _parse_config(reader, buf)
+        _PARSE_CACHE[config_path] = (st.st_mtime_ns, st.st_size, buf, None)
+        return data
+
+    except FileNotFoundError:
+        raise
+
+    except _READ_ERRORS as e:
+        self._error.append(f"Failed to read config file: {str(e)}")
+        self._is_available = False
+        return {}
+
+
+def _create_config_file(self) -> None:
+    """Create a new configuration file from class defaults.
+
+    Collects public, non-callable class attributes (excluding
+    ``error`` and ``is_available``) and writes them to the
+    configured file in the detected format. The payload serialized
+    at decoration time (``_seed_payload``) is written as-is when its
+    format still matches.
+    """
+    cls = self.__class__
+    config_path = cls._config_path
+    try:
+        seed = cls._seed_payload
+
+        # Reuse the payload serialized at decoration time if it matches
+        if seed is not None and seed[0] is cls._config_type:
+            with _open_for_write(config_path) as f:
+                f.write(seed[1])
+            return
+
+        # Gather class-level defaults (exclude privates and callables)
+        config_data: Dict[str, Any] = {
+            attr_name: getattr(cls, attr_name) for attr_name in cls._config_attrs
+        }
+
+        self._write_config_file(config_path, config_data)
+
+    except _WRITE_ERRORS as e:
+        self._error.append(f"Failed to create config file: {str(e)}")
+        self._is_available = False
+
+
+def _write_config_file(self, config_path: Path, data: Dict[str, Any]) -> None:
+    """Write configuration data to file using the configured format.
+
+    Args:
+        config_path: Destination path.
+        data: A dictionary of configuration values.
+
+    Raises:
+        Any exception raised by underlying filesystem or parser
+        libraries will propagate to the caller.
+    """
+    dumper = _DUMPERS.get(self.__class__._config_type)
+    if dumper is not None:
+        with _open_for_write(config_path) as f:
+            dumper(data, f)
+
+
+def _save(self) -> None:
+    """Persist current instance attributes back to the file.
+
+    Behavior:
+        Writes every attribute in ``_config_attrs`` to the configured
+        file, preferring instance values over class defaults.
+
+    Side Effects:
+        On failure, records error messages and marks the config as
+        unavailable.
+    """
+    cls = self.__class__
+    try:
+        instance_values = getattr(self, "__dict__", {})
+        config_data: Dict[str, Any] = {
+            attr_name: instance_values.get(attr_name, getattr(cls, attr_name))
+            for attr_name in cls._config_attrs
+        }
+
+        self._write_config_file(cls._config_path, config_data)
+
+    except _WRITE_ERRORS as e:
+        self._error.append(f"Failed to save config file: {str(e)}")
+        self._is_available = False
+
+
+@property
+def _error_property(self) -> List[str]:
+    """List[str]: Collected error messages during config operations."""
+    return self._error
+
+
+@property
+def _is_available_property(self) -> bool:
+    """bool: Whether the config is currently available/healthy."""
+    return self._is_available
+
+
+@_is_available_property.setter
+def _is_available_property(self, value: bool) -> None:
+    """Set availability state.
+
+    Args:
+        value: ``True`` if the instance is considered healthy, else ``False``.
+    """
+    self._is_available = value
+
+
 class Config:
     """Class decorator to bind config file I/O to a class.
 
@@ -83,17 +537,7 @@ class Config:
             The detected :class:`ConfigType`. Defaults to JSON if the suffix
             is not recognized.
         """
-        suffix = file_path.suffix.lower()
-        suffix_map = {
-            ".json": ConfigType.JSON,
-            ".toml": ConfigType.TOML,
-            ".yaml": ConfigType.YAML,
-            ".yml": ConfigType.YAML,
-            ".ini": ConfigType.INI,
-            ".cfg": ConfigType.INI,
-            ".conf": ConfigType.INI,
-        }
-        return suffix_map.get(suffix, ConfigType.JSON)
+        return _SUFFIX_MAP.get(file_path.suffix.lower(), ConfigType.JSON)
 
     def __call__(self, cls):
         """Decorator entrypoint that augments the target class.
@@ -107,13 +551,31 @@ class Config:
             * ``save``
             * ``error`` (property)
             * ``is_available`` (property)
+            * ``_config_attrs`` (tuple of config-backed attribute names)
+            * ``_seed_payload`` (``(ConfigType, bytes)`` of serialized defaults,
+              or ``None``)
+            * ``_detected_type`` (``(Path, ConfigType)`` the type was detected
+              from, or ``None`` if it was given explicitly)
 
         Args:
             cls: The target class to be decorated.
 
         Returns:
-            The augmented class.
+            The augmented class (the same class object, modified in place).
+
+        Raises:
+            TypeError: If instances of ``cls`` have no ``__dict__`` (a
+                ``__slots__`` class that does not list ``"__dict__"``).
         """
+        # Config values are class defaults overridden per instance, and the
+        # injected state is assigned per instance: both need a __dict__
+        if not cls.__dictoffset__:
+            raise TypeError(
+                f"@Config needs instances with a __dict__, but "
+                f"{cls.__qualname__} declares __slots__ without it; add "
+                f"'__dict__' to __slots__"
+            )
+
         original_init = cls.__init__
 
         def new_init(self, *args, **kwargs):
@@ -134,257 +596,22 @@ class Config:
             # Call the original initializer
             original_init(self, *args, **kwargs)
 
-            # Resolve config type if a path is set and type is missing
-            if self.__class__._config_path:
-                if self.__class__._config_type is None:
-                    self.__class__._config_type = self.__class__._detect_config_type(
-                        self.__class__._config_path
-                    )
+            # Resolve config type if a path is set and type is missing, or
+            # re-detect if the path it was detected from has been reassigned
+            cls = self.__class__
+            config_path = cls._config_path
+            if config_path:
+                detected = cls._detected_type
+                if cls._config_type is None or (
+                    detected is not None and detected[0] != config_path
+                ):
+                    config_type = cls._detect_config_type(config_path)
+                    cls._config_type = config_type
+                    cls._detected_type = (config_path, config_type)
 
             # Load config values
             self._load_config()
 
-        def _detect_config_type(cls, file_path: Path) -> ConfigType:
-            """Detect configuration type from file suffix (class-level).
-
-            Args:
-                cls: The decorated class (unused, present for ``classmethod`` binding).
-                file_path: The target config file path.
-
-            Returns:
-                The detected :class:`ConfigType`. Defaults to JSON if unknown.
-            """
-            suffix = file_path.suffix.lower()
-            suffix_map = {
-                ".json": ConfigType.JSON,
-                ".toml": ConfigType.TOML,
-                ".yaml": ConfigType.YAML,
-                ".yml": ConfigType.YAML,
-                ".ini": ConfigType.INI,
-                ".cfg": ConfigType.INI,
-                ".conf": ConfigType.INI,
-            }
-            return suffix_map.get(suffix, ConfigType.JSON)
-
-        def _load_config(self) -> None:
-            """Load configuration from the configured file.
-
-            Behavior:
-                * If the config file is present, reads values and sets instance
-                  attributes for public class attributes found in the file.
-                * If the config file does not exist, creates it from the class
-                  defaults.
-                * Non-fatal errors are collected in ``self._error``.
-
-            Side Effects:
-                Updates ``self._is_available`` on failure.
-            """
-            if not self.__class__._config_path:
-                self._error.append("Config file path is not specified.")
-                self._is_available = False
-                return
-
-            config_path = self.__class__._config_path
-
-            try:
-                if config_path.exists():
-                    # Read config file
-                    data = self._read_config_file(config_path)
-
-                    # Populate instance attributes from data
-                    for attr_name, attr_value in self.__class__.__dict__.items():
-                        if not attr_name.startswith("_") and not callable(attr_value):
-                            if attr_name in ["error", "is_available"]:
-                                continue
-                            if attr_name in data:
-                                setattr(self, attr_name, data[attr_name])
-                            else:
-                                # If missing, set to None for list/dict defaults
-                                if isinstance(attr_value, (list, dict)):
-                                    setattr(self, attr_name, None)
-                else:
-                    # Create a new config file seeded with class defaults
-                    self._create_config_file()
-
-            except Exception as e:  # noqa: BLE001
-                self._error.append(f"Error while loading config file: {str(e)}")
-                self._is_available = False
-
-        def _read_config_file(self, config_path: Path) -> Dict[str, Any]:
-            """Read configuration file content into a dict.
-
-            Args:
-                config_path: The path to the configuration file.
-
-            Returns:
-                A dictionary of configuration values. On failure, returns an
-                empty dict and records the error.
-
-            Side Effects:
-                Updates ``self._is_available`` on failure and appends messages
-                to ``self._error``.
-            """
-            config_type = self.__class__._config_type
-
-            try:
-                if config_type == ConfigType.JSON:
-                    with open(config_path, "r", encoding="utf-8") as f:
-                        return json.load(f)
-
-                if config_type == ConfigType.TOML:
-                    with open(config_path, "r", encoding="utf-8") as f:
-                        return toml.load(f)
-
-                if config_type == ConfigType.YAML:
-                    with open(config_path, "r", encoding="utf-8") as f:
-                        return yaml.safe_load(f)
-
-                if config_type == ConfigType.INI:
-                    parser = configparser.ConfigParser()
-                    parser.read(config_path, encoding="utf-8")
-                    result: Dict[str, Any] = {}
-                    for section in parser.sections():
-                        result[section] = dict(parser[section])
-                    # If no named sections exist, read DEFAULTs
-                    if not result and parser.defaults():
-                        result = dict(parser.defaults())
-                    return result
-
-            except Exception as e:  # noqa: BLE001
-                self._error.append(f"Failed to read config file: {str(e)}")
-                self._is_available = False
-                return {}
-
-            # Fallback: unknown type means empty config
-            return {}
-
-        def _create_config_file(self) -> None:
-            """Create a new configuration file from class defaults.
-
-            Collects public, non-callable class attributes (excluding
-            ``error`` and ``is_available``) and writes them to the
-            configured file in the detected format.
-            """
-            try:
-                config_data: Dict[str, Any] = {}
-
-                # Gather class-level defaults (exclude privates and callables)
-                for attr_name, attr_value in self.__class__.__dict__.items():
-                    if (
-                        not attr_name.startswith("_")
-                        and not callable(attr_value)
-                        and attr_name not in ["error", "is_available"]
-                    ):
-                        config_data[attr_name] = attr_value
-
-                self._write_config_file(self.__class__._config_path, config_data)
-
-            except Exception as e:  # noqa: BLE001
-                self._error.append(f"Failed to create config file: {str(e)}")
-                self._is_available = False
-
-        def _write_config_file(self, config_path: Path, data: Dict[str, Any]) -> None:
-            """Write configuration data to file using the configured format.
-
-            Args:
-                config_path: Destination path.
-                data: A dictionary of configuration values.
-
-            Raises:
-                Any exception raised by underlying filesystem or parser
-                libraries will propagate to the caller.
-            """
-            config_type = self.__class__._config_type
-
-            # Ensure the parent directory exists
-            config_path.parent.mkdir(parents=True, exist_ok=True)
-
-            if config_type == ConfigType.JSON:
-                with open(config_path, "w", encoding="utf-8") as f:
-                    json.dump(data, f, ensure_ascii=False, indent=2)
-
-            elif config_type == ConfigType.TOML:
-                with open(config_path, "w", encoding="utf-8") as f:
-                    toml.dump(data, f)
-
-            elif config_type == ConfigType.YAML:
-                with open(config_path, "w", encoding="utf-8") as f:
-                    yaml.dump(
-                        data,
-                        f,
-                        default_flow_style=False,
-                        allow_unicode=True,
-                    )
-
-            elif config_type == ConfigType.INI:
-                parser = configparser.ConfigParser()
-
-                # Split nested dicts into sections; keep scalars in DEFAULT
-                default_section: Dict[str, str] = {}
-                sections: Dict[str, Dict[str, str]] = {}
-
-                for key, value in data.items():
-                    if isinstance(value, dict):
-                        sections[key] = {k: str(v) for k, v in value.items()}
-                    else:
-                        default_section[key] = str(value)
-
-                if default_section:
-                    parser["DEFAULT"] = default_section
-
-                for section_name, section_data in sections.items():
-                    parser[section_name] = section_data
-
-                with open(config_path, "w", encoding="utf-8") as f:
-                    parser.write(f)
-
-        def save(self) -> None:
-            """Persist current instance attributes back to the file.
-
-            Behavior:
-                Iterates over public, non-callable instance attributes and
-                writes them to the configured file.
-
-            Side Effects:
-                On failure, records error messages and marks the config as
-                unavailable.
-            """
-            try:
-                config_data: Dict[str, Any] = {}
-
-                for attr_name in dir(self):
-                    if (
-                        not attr_name.startswith("_")
-                        and not callable(getattr(self, attr_name))
-                        and attr_name not in ["error", "is_available"]
-                    ):
-                        config_data[attr_name] = getattr(self, attr_name)
-
-                self._write_config_file(self.__class__._config_path, config_data)
-
-            except Exception as e:  # noqa: BLE001
-                self._error.append(f"Failed to save config file: {str(e)}")
-                self._is_available = False
-
-        @property
-        def error(self) -> List[str]:
-            """List[str]: Collected error messages during config operations."""
-            return self._error
-
-        @property
-        def is_available(self) -> bool:
-            """bool: Whether the config is currently available/healthy."""
-            return self._is_available
-
-        @is_available.setter
-        def is_available(self, value: bool) -> None:
-            """Set availability state.
-
-            Args:
-                value: ``True`` if the instance is considered healthy, else ``False``.
-            """
-            self._is_available = value
-
         # Attach methods to the class
         cls.__init__ = new_init
         cls._detect_config_type = classmethod(_detect_config_type)
@@ -392,13 +619,43 @@ class Config:
         cls._read_config_file = _read_config_file
         cls._create_config_file = _create_config_file
         cls._write_config_file = _write_config_file
-        cls.save = save
-        cls.error = error
-        cls.is_available = is_available
+        cls.save = _save
+        cls.error = _error_property
+        cls.is_available = _is_available_property
 
-        # Store config hints on the class
+        # Store config hints on the class; detect the type once up front
         cls._config_path = self.path
         cls._config_type = self.config_type
+        cls._detected_type = None
+        if self.path and self.config_type is None:
+            cls._config_type = self._detect_config_type(self.path)
+            cls._detected_type = (self.path, cls._config_type)
+
+        # Public, non-callable class attributes backed by the config file
+        cls._config_attrs = tuple(
+            attr_name
+            for attr_name, attr_value in cls.__dict__.items()
+            if not attr_name.startswith("_")
+            and not callable(attr_value)
+            and not isinstance(attr_value, types.MemberDescriptorType)
+            and attr_name not in _SKIP_ATTRS
+        )
+
+        # Class defaults never change, so serialize the seed file up front
+        cls._seed_payload = None
+        seed_type = cls._config_type
+        if seed_type in _DUMPERS:
+            try:
+                cls._seed_payload = (
+                    seed_type,
+                    _serialize(
+                        seed_type,
+                        {name: getattr(cls, name) for name in cls._config_attrs},
+                    ),
+                )
+            except _WRITE_ERRORS:
+                # Leave it to _create_config_file to surface the error
+                pass
 
         return cls
 
@@ -1,23 +1,111 @@
-from dataclasses import dataclass
+from functools import lru_cache
+import logging
 from src.magilib.database.model.structure import MagiTable, MagiTableColumn
+from src.magilib.database.table_construct import DefineDataFrameColumns, TableConstruct
 from typing import List, Optional
+import numpy as np
 import pandas as pd
 from enum import Enum
 
+try:  # 可选: pyarrow的CSV解析器更快
+    import pyarrow as pa
+    from pyarrow import csv as pa_csv
+except ImportError:
+    pa = None
 
-@dataclass(frozen=True)
-class DefineDataFrameColumns:
-    name: str = 'name'
-    data_type: str = 'data_type'
-    length: str = 'length'
-    precision: str = 'precision'
-    primary_key: str = 'primary_key'
-    unique: str = 'unique'
-    not_null: str = 'not_null'
-    default: str = 'default'
-    comment: str = 'comment'
-    # 新增生成值列
-    generated_value: str = 'generated_value'
+
+# 进度/状态信息走logging（需要输出时由调用方配置日志级别），批量循环中不再写stdout
+logger = logging.getLogger(__name__)
+
+
+# 数据类型分类
+_TEXT_TYPES = frozenset({'VARCHAR', 'VARCHAR2', 'CHAR', 'NVARCHAR', 'NCHAR', 'TEXT', 'CLOB'})
+_NUMBER_TYPES = frozenset({'INTEGER', 'INT', 'NUMBER', 'DECIMAL', 'NUMERIC', 'FLOAT', 'DOUBLE'})
+_DATE_TYPES = frozenset({'DATE', 'TIMESTAMP', 'DATETIME'})
+_BOOL_TYPES = frozenset({'BOOLEAN', 'BOOL'})
+
+# 数据类型 -> 分类（一次哈希查找完成分派）
+_TYPE_TO_KIND = {
+    **dict.fromkeys(_TEXT_TYPES, 'TEXT'),
+    **dict.fromkeys(_NUMBER_TYPES, 'NUMBER'),
+    **dict.fromkeys(_DATE_TYPES, 'DATE'),
+    **dict.fromkeys(_BOOL_TYPES, 'BOOL'),
+}
+
+
+@lru_cache(maxsize=64)
+def _type_kind(data_type: str) -> Optional[str]:
+    """数据类型分类（大小写无关），同一类型字符串只计算一次"""
+    return _TYPE_TO_KIND.get(data_type.upper())
+
+
+def _is_missing(value) -> bool:
+    """None/NaN/pd.NA 视为未指定（与DataFrame路径的缺失值处理一致）"""
+    return value is None or bool(pd.isna(value))
+
+
+# 预生成的N填充池，按需切片，避免每次重复 'N' * n
+_N_POOL = 'N' * 4096
+
+
+def _n_str(n: int) -> str:
+    """长度为n的N填充串"""
+    return _N_POOL[:n] if n <= len(_N_POOL) else 'N' * n
+
+
+@lru_cache(maxsize=256)
+def _text_literal(clean_comment: str, actual_length: int) -> str:
+    """comment + N填充到指定长度的文字字面量，(comment, 长度) 相同时直接复用"""
+    if len(clean_comment) >= actual_length:
+        # 如果comment太长，截取到指定长度
+        return f"'{clean_comment[:actual_length]}'"
+    # comment + N填充到指定长度（没有comment时只用N填充）
+    return f"'{clean_comment}{_n_str(actual_length - len(clean_comment))}'"
+
+
+# CSV往返时各列的类型（显式指定，跳过pandas的类型推断；生成值始终按文字读回）
+_CSV_DTYPES = {
+    DefineDataFrameColumns.name: 'string',
+    DefineDataFrameColumns.data_type: 'string',
+    DefineDataFrameColumns.length: 'Int64',
+    DefineDataFrameColumns.precision: 'Int64',
+    DefineDataFrameColumns.primary_key: 'boolean',
+    DefineDataFrameColumns.unique: 'boolean',
+    DefineDataFrameColumns.not_null: 'boolean',
+    DefineDataFrameColumns.default: 'string',
+    DefineDataFrameColumns.comment: 'string',
+    DefineDataFrameColumns.generated_value: 'string',
+}
+
+if pa is not None:
+    # pyarrow直接按列类型解析（pandas的pyarrow引擎会先推断类型再转换，
+    # '9'*20 / '007' / 'TRUE' 这类文字会被改写），只把空单元格当作缺失值
+    _ARROW_CONVERT_OPTIONS = pa_csv.ConvertOptions(
+        column_types={column: {'string': pa.string(), 'Int64': pa.int64(), 'boolean': pa.bool_()}[dtype]
+                      for column, dtype in _CSV_DTYPES.items()},
+        null_values=[''],
+        strings_can_be_null=True,
+    )
+    # 读回与C引擎相同的可空类型
+    _ARROW_TO_PANDAS = {
+        pa.string(): pd.StringDtype(),
+        pa.int64(): pd.Int64Dtype(),
+        pa.bool_(): pd.BooleanDtype(),
+    }
+
+
+# generate_dataframe 各列的缓冲区类型（列名与 MagiTableColumn 字段同名；可空整数用pandas的Int64，CSV里保持整数）
+_BUFFER_DTYPES = {
+    DefineDataFrameColumns.name: object,
+    DefineDataFrameColumns.data_type: object,
+    DefineDataFrameColumns.length: 'Int64',
+    DefineDataFrameColumns.precision: 'Int64',
+    DefineDataFrameColumns.primary_key: bool,
+    DefineDataFrameColumns.unique: bool,
+    DefineDataFrameColumns.not_null: bool,
+    DefineDataFrameColumns.default: object,
+    DefineDataFrameColumns.comment: object,
+}
 
 
 class LengthRatio(Enum):
@@ -53,156 +141,190 @@ class TestDataGenerator:
     
     def generate_text_value(self, column: MagiTableColumn) -> str:
         """生成文字类型的值"""
-        max_length = column.length or 1
+        max_length = 1 if _is_missing(column.length) else column.length or 1
         actual_length = self.calculate_actual_length(max_length)
         
         if self.text_fill_mode == TextFillMode.COMMENT_PLUS_N:
-            comment = column.comment or ""
+            comment = "" if _is_missing(column.comment) else column.comment
             # 移除comment中的引号，避免SQL语法错误
             clean_comment = comment.replace("'", "").replace('"', '')
-            
-            if clean_comment:
-                # 计算comment长度，剩余用N填充
-                comment_length = len(clean_comment)
-                if comment_length >= actual_length:
-                    # 如果comment太长，截取到指定长度
-                    result_text = clean_comment[:actual_length]
-                else:
-                    # comment + N填充到指定长度
-                    n_count = actual_length - comment_length
-                    result_text = clean_comment + 'N' * n_count
-            else:
-                # 没有comment，只用N填充
-                result_text = 'N' * actual_length
         else:
             # 只用N填充
-            result_text = 'N' * actual_length
+            clean_comment = ""
+        
+        return _text_literal(clean_comment, actual_length)
+    
+    def _batch_text_values(self, comments: pd.Series, lengths: np.ndarray) -> List[str]:
+        """批量生成文字类型的值（与generate_text_value逐列结果一致）"""
+        # 未指定长度时为1，按比例计算，至少为1
+        max_lengths = np.where(lengths == 0, 1, lengths)
+        actual_lengths = np.where(max_lengths <= 0, 1,
+                                  np.maximum(1, (max_lengths * self.length_ratio.value).astype(int)))
+        
+        if self.text_fill_mode == TextFillMode.COMMENT_PLUS_N:
+            # 移除comment中的引号，避免SQL语法错误（整列一次完成）
+            clean_comments = comments.fillna('').str.replace('[\'"]', '', regex=True).tolist()
+        else:
+            # 只用N填充
+            clean_comments = [''] * len(comments)
         
-        return f"'{result_text}'"
+        # 每列长度不同，截取/填充逐个进行（(comment, 长度) 相同的结果已缓存）
+        return [_text_literal(clean_comment, int(actual_length))
+                for clean_comment, actual_length in zip(clean_comments, actual_lengths)]
     
     def generate_number_value(self, column: MagiTableColumn) -> str:
         """生成数字类型的值"""
-        max_length = column.length or 9
+        max_length = 9 if _is_missing(column.length) else column.length or 9
         actual_length = self.calculate_actual_length(max_length)
         return '9' * actual_length
     
     def generate_default_value(self, column: MagiTableColumn) -> str:
         """根据列的数据类型生成默认值"""
-        data_type = column.data_type.upper()
+        # 未指定类型（None/NaN）时按默认情况处理
+        data_type = column.data_type
+        kind = _type_kind(data_type) if isinstance(data_type, str) else None
         
         # 字符串类型
-        if data_type in ['VARCHAR', 'VARCHAR2', 'CHAR', 'NVARCHAR', 'NCHAR', 'TEXT', 'CLOB']:
+        if kind == 'TEXT':
             return self.generate_text_value(column)
         
         # 数字类型
-        elif data_type in ['INTEGER', 'INT', 'NUMBER', 'DECIMAL', 'NUMERIC', 'FLOAT', 'DOUBLE']:
+        elif kind == 'NUMBER':
             return self.generate_number_value(column)
         
         # 日期类型
-        elif data_type in ['DATE', 'TIMESTAMP', 'DATETIME']:
+        elif kind == 'DATE':
             return self.ORACLE_MAX_DATE
         
         # 布尔类型
-        elif data_type in ['BOOLEAN', 'BOOL']:
+        elif kind == 'BOOL':
             return 'TRUE'
         
         # 默认情况
         else:
             return 'NULL'
     
+    def _generated_value(self, column: MagiTableColumn) -> str:
+        """列的测试值，有默认值时优先使用默认值（规则与generate_dataframe一致）"""
+        default = column.default
+        if not _is_missing(default) and default != '' and default != 'NULL':
+            return default
+        return self.generate_default_value(column)
+    
+    def generate_inserts(self, table: MagiTable, table_name: str, schema_name: Optional[str] = None,
+                         rows_count: int = 1) -> List[str]:
+        """直接基于表结构生成INSERT语句（不经过DataFrame）"""
+        column_names = [column.name for column in table.columns]
+        generated_values = [self._generated_value(column) for column in table.columns]
+        insert_sql = self._build_insert_sql(table_name, schema_name, column_names, generated_values)
+        return [insert_sql] * rows_count
+    
+    @staticmethod
+    def _build_insert_sql(table_name: str, schema_name: Optional[str],
+                          column_names: List[str], generated_values: List[str]) -> str:
+        """拼接单条INSERT语句"""
+        # 构建表名
+        full_table_name = table_name
+        if schema_name:
+            full_table_name = f"{schema_name}.{table_name}"
+        
+        columns_str = ', '.join(column_names)
+        values_str = ', '.join(generated_values)
+        return f"INSERT INTO {full_table_name} ({columns_str}) VALUES ({values_str});"
+    
     def generate_dataframe(self, table: MagiTable) -> pd.DataFrame:
         """生成包含表结构和测试值的DataFrame"""
-        # 获取排序后的列
-        sorted_columns = sorted(table.columns.values(), key=lambda x: x.no or 0)
-        
-        # 准备DataFrame数据
-        data = {
-            DefineDataFrameColumns.name: [],
-            DefineDataFrameColumns.data_type: [],
-            DefineDataFrameColumns.length: [],
-            DefineDataFrameColumns.precision: [],
-            DefineDataFrameColumns.primary_key: [],
-            DefineDataFrameColumns.unique: [],
-            DefineDataFrameColumns.not_null: [],
-            DefineDataFrameColumns.default: [],
-            DefineDataFrameColumns.comment: [],
-            DefineDataFrameColumns.generated_value: []
-        }
-        
-        # 填充数据
-        for column in sorted_columns:
-            data[DefineDataFrameColumns.name].append(column.name)
-            data[DefineDataFrameColumns.data_type].append(column.data_type)
-            data[DefineDataFrameColumns.length].append(column.length)
-            data[DefineDataFrameColumns.precision].append(column.precision)
-            data[DefineDataFrameColumns.primary_key].append(column.primary_key)
-            data[DefineDataFrameColumns.unique].append(column.unique)
-            data[DefineDataFrameColumns.not_null].append(column.not_null)
-            data[DefineDataFrameColumns.default].append(column.default)
-            data[DefineDataFrameColumns.comment].append(column.comment)
-            
-            # 生成测试值
-            if column.default and column.default != 'NULL':
-                generated_value = column.default
+        # 列已按列序(no)保存，无需再排序
+        columns = table.columns
+
+        # 准备DataFrame数据（每列预分配定长的类型化缓冲区，按列整体填充）
+        n = len(columns)
+        buffers = {}
+        for field, dtype in _BUFFER_DTYPES.items():
+            values = [getattr(column, field) for column in columns]
+            if dtype == 'Int64':
+                buffers[field] = pd.array(values, dtype=dtype)
             else:
-                generated_value = self.generate_default_value(column)
-            data[DefineDataFrameColumns.generated_value].append(generated_value)
-        
-        self.data_frame = pd.DataFrame(data)
+                buffers[field] = np.empty(n, dtype=dtype)
+                buffers[field][:] = values
+        df = pd.DataFrame(buffers, copy=False)
+
+        # 按数据类型分类（布尔掩码）
+        kinds = df[DefineDataFrameColumns.data_type].str.upper().map(_TYPE_TO_KIND).to_numpy()
+        is_text = kinds == 'TEXT'
+        is_number = kinds == 'NUMBER'
+        is_date = kinds == 'DATE'
+        is_bool = kinds == 'BOOL'
+
+        # 数字类型: 未指定位数时默认9，按比例计算，至少为1
+        lengths = df[DefineDataFrameColumns.length].fillna(0).to_numpy()
+        number_lengths = np.where(lengths == 0, 9, lengths)
+        number_lengths = np.maximum(1, (number_lengths * self.length_ratio.value).astype(int))
+
+        # 生成测试值
+        generated = np.full(len(df), 'NULL', dtype=object)
+        generated[is_text] = self._batch_text_values(df[DefineDataFrameColumns.comment][is_text],
+                                                     lengths[is_text])
+        generated[is_number] = ['9' * width for width in number_lengths[is_number]]
+        generated[is_date] = self.ORACLE_MAX_DATE
+        generated[is_bool] = 'TRUE'
+
+        # 有默认值时优先使用默认值
+        defaults = df[DefineDataFrameColumns.default]
+        has_default = defaults.notna() & (defaults != '') & (defaults != 'NULL')
+        df[DefineDataFrameColumns.generated_value] = defaults.where(has_default, generated)
+
+        self.data_frame = df
         return self.data_frame
-    
+
     def set_length_ratio(self, ratio: LengthRatio):
         """设置长度比例"""
         self.length_ratio = ratio
-        print(f"长度比例已设置为: {ratio.name} ({ratio.value})")
+        logger.debug("长度比例已设置为: %s (%s)", ratio.name, ratio.value)
     
     def set_text_fill_mode(self, mode: TextFillMode):
         """设置文字填充模式"""
         self.text_fill_mode = mode
-        print(f"文字填充模式已设置为: {mode.value}")
+        logger.debug("文字填充模式已设置为: %s", mode.value)
     
     def save_dataframe_to_csv(self, file_path: str) -> None:
         """保存DataFrame到CSV文件"""
         if self.data_frame is None:
             raise ValueError("DataFrame未生成，请先调用generate_dataframe方法")
         
-        self.data_frame.to_csv(file_path, index=False, encoding='utf-8')
-        print(f"DataFrame已保存到: {file_path}")
+        self.data_frame.to_csv(file_path, index=False, encoding='utf-8', lineterminator='\n')
+        logger.info("DataFrame已保存到: %s", file_path)
     
     def load_dataframe_from_csv(self, file_path: str) -> pd.DataFrame:
         """从CSV文件加载DataFrame"""
-        self.data_frame = pd.read_csv(file_path, encoding='utf-8')
+        # 只把空单元格当作缺失值，生成值里的 NULL 字面量按原样读回
+        if pa is not None:
+            table = pa_csv.read_csv(file_path, convert_options=_ARROW_CONVERT_OPTIONS)
+            self.data_frame = table.to_pandas(types_mapper=_ARROW_TO_PANDAS.get)
+        else:
+            self.data_frame = pd.read_csv(file_path, encoding='utf-8', dtype=_CSV_DTYPES,
+                                          keep_default_na=False, na_values=[''])
         return self.data_frame
     
     def generate_insert_from_dataframe(self, table_name: str, schema_name: Optional[str] = None, 
                                      rows_count: int = 1, output_csv: Optional[str] = None) -> List[str]:
-        """基于DataFrame生成INSERT语句"""
+        """基于DataFrame生成INSERT语句（用于CSV往返；只需语句时generate_inserts更快）"""
         if self.data_frame is None:
             raise ValueError("DataFrame未加载，请先调用generate_dataframe或load_dataframe_from_csv方法")
         
-        # 构建表名
-        full_table_name = table_name
-        if schema_name:
-            full_table_name = f"{schema_name}.{table_name}"
-        
         # 获取列名和生成的值
         column_names = self.data_frame[DefineDataFrameColumns.name].tolist()
         generated_values = self.data_frame[DefineDataFrameColumns.generated_value].tolist()
         
-        # 生成INSERT语句
-        insert_statements = []
-        for row_index in range(rows_count):
-            columns_str = ', '.join(column_names)
-            values_str = ', '.join(generated_values)
-            
-            insert_sql = f"INSERT INTO {full_table_name} ({columns_str}) VALUES ({values_str});"
-            insert_statements.append(insert_sql)
+        # 生成INSERT语句（每行内容相同，只拼接一次）
+        insert_sql = self._build_insert_sql(table_name, schema_name, column_names, generated_values)
+        insert_statements = [insert_sql] * rows_count
         
         # 可选输出到CSV
         if output_csv:
             insert_df = pd.DataFrame({'insert_statements': insert_statements})
             insert_df.to_csv(output_csv, index=False, encoding='utf-8')
-            print(f"INSERT语句已保存到: {output_csv}")
+            logger.info("INSERT语句已保存到: %s", output_csv)
         
         return insert_statements
     
@@ -223,13 +345,10 @@ class TestDataGenerator:
         
         columns_str = ', '.join(column_names)
         
-        # 生成多行值
-        values_list = []
-        for row_index in range(rows_count):
-            values_str = ', '.join(generated_values)
-            values_list.append(f"({values_str})")
-        
-        batch_values_str = ',\n  '.join(values_list)
+        # 生成多行值（每行内容相同，"行+分隔符"整体重复，不构建中间列表）
+        row_tuple = f"({', '.join(generated_values)})"
+        batch_values_str = ((row_tuple + ',\n  ') * (rows_count - 1) + row_tuple
+                            if rows_count > 0 else '')
         
         batch_insert_sql = f"""INSERT INTO {full_table_name} ({columns_str}) 
 VALUES 
@@ -239,86 +358,11 @@ VALUES
         if output_csv:
             insert_df = pd.DataFrame({'batch_insert_statement': [batch_insert_sql]})
             insert_df.to_csv(output_csv, index=False, encoding='utf-8')
-            print(f"批量INSERT语句已保存到: {output_csv}")
+            logger.info("批量INSERT语句已保存到: %s", output_csv)
         
         return batch_insert_sql
 
 
-from dataclasses import dataclass
-
-from abc import ABC, abstractmethod
-from typing import Dict, List
-import pandas as pd
-
-from src.magilib.database.model.structure import MagiTable, MagiTableColumn, MagiTableIndex
-from typing import List
-
-
-class TableConstruct(ABC):
-
-    def __init__(self):
-        self.table_name: str or None = None
-        self.table_comment: str or None = None
-        self.table_schema: str or None = None
-        self.indexes: Dict[str, MagiTableIndex] = {}
-
-        self.columns_view: pd.DataFrame = pd.DataFrame(columns=[
-            DefineDataFrameColumns.name,
-            DefineDataFrameColumns.data_type,
-            DefineDataFrameColumns.length,
-            DefineDataFrameColumns.scale,
-            DefineDataFrameColumns.primary_key,
-            DefineDataFrameColumns.unique,
-            DefineDataFrameColumns.not_null,
-            DefineDataFrameColumns.default,
-            DefineDataFrameColumns.comment,
-        ])
-
-    # <editor-fold desc="Read From Excel Table Design Book, gather define to magi dedicated csv">
-    @abstractmethod
-    def read_define(self):
-        self.read_define_schema()
-        self.read_define_columns()
-        self.read_define_indexes()
-
-    @abstractmethod
-    def read_define_schema(self): ...
-
-    @abstractmethod
-    def read_define_columns(self): ...
-
-    @abstractmethod
-    def read_define_indexes(self): ...
-
-    # </editor-fold>
-
-    def __extract_columns_to_magi_columns(self) -> Dict[str, MagiTableColumn]:
-        dictionary: Dict[str, MagiTableColumn] = {}
-        for index, (_, row) in enumerate(self.columns_view.iterrows()):
-            iter_column = MagiTableColumn('', '')
-            iter_column.name = row[DefineDataFrameColumns.name]
-            iter_column.data_type = row[DefineDataFrameColumns.data_type]
-            iter_column.length = row[DefineDataFrameColumns.length]
-            iter_column.scale = row[DefineDataFrameColumns.scale]
-            iter_column.primary_key = row[DefineDataFrameColumns.primary_key]
-            iter_column.unique = row[DefineDataFrameColumns.unique]
-            iter_column.not_null = row[DefineDataFrameColumns.not_null]
-            iter_column.default = row[DefineDataFrameColumns.default]
-            iter_column.comment = row[DefineDataFrameColumns.comment]
-            iter_column.no = index + 1
-            dictionary[iter_column.name] = iter_column
-        return dictionary
-
-    def magi_table_factory(self) -> MagiTable:
-        self.read_define()
-        object = MagiTable(self.table_name)
-        object.table_comment = self.table_comment
-        object.table_schema = self.table_schema
-        object.columns = self.__extract_columns_to_magi_columns()
-        object.indexes = self.indexes
-        return object
-
-
  # Usage Example:
 class DemoTableLConstructImpl(TableConstruct):
 
@@ -346,11 +390,11 @@ if __name__ == "__main__":
     table.table_schema = "test_schema"
     
     # 添加列
-    table.columns["id"] = MagiTableColumn("id", "INTEGER", length=10, primary_key=True, not_null=True, no=1, comment="主键ID")
-    table.columns["name"] = MagiTableColumn("name", "VARCHAR", length=50, not_null=True, no=2, comment="用户姓名")
-    table.columns["email"] = MagiTableColumn("email", "VARCHAR", length=100, unique=True, no=3, comment="邮箱地址")
-    table.columns["amount"] = MagiTableColumn("amount", "NUMBER", length=15, no=4, comment="金额")
-    table.columns["created_date"] = MagiTableColumn("created_date", "DATE", default="SYSDATE", no=5, comment="创建日期")
+    table.columns.append(MagiTableColumn("id", "INTEGER", length=10, primary_key=True, not_null=True, no=1, comment="主键ID"))
+    table.columns.append(MagiTableColumn("name", "VARCHAR", length=50, not_null=True, no=2, comment="用户姓名"))
+    table.columns.append(MagiTableColumn("email", "VARCHAR", length=100, unique=True, no=3, comment="邮箱地址"))
+    table.columns.append(MagiTableColumn("amount", "NUMBER", length=15, no=4, comment="金额"))
+    table.columns.append(MagiTableColumn("created_date", "DATE", default="SYSDATE", no=5, comment="创建日期"))
     
     print("=== 测试不同的长度比例和填充模式 ===")
     
@@ -1,7 +1,29 @@
 
+from functools import lru_cache
+
 from src.magilib.database.model.structure import MagiDDL, MagiTable, MagiTableColumn, MagiTableIndex
 
 
+# typed: 100 and 100.0 (or 1 and True) must not share an entry, they format differently
+@lru_cache(maxsize=1024, typed=True)
+def _column_suffix(data_type: str, length, primary_key: bool, not_null: bool, default) -> str:
+    # Everything after the column name; schemas repeat a small set of column
+    # shapes, so each distinct shape is only formatted once
+    parts = [data_type]
+
+    if length and data_type.lower() in ('varchar', 'char'):
+        parts[0] = f"{data_type}({length})"
+
+    if primary_key:
+        parts.append('PRIMARY KEY')
+    if not_null:
+        parts.append('NOT NULL')
+    if default is not None:
+        parts.append(f"DEFAULT {default}")
+
+    return ' ' + ' '.join(parts)
+
+
 class DDLConstruct:
     SUPPORTED_DATABASES = ['oracle', 'postgres']
 
@@ -9,19 +31,8 @@ class DDLConstruct:
         pass
 
     def _build_column_definition(self, column: 'MagiTableColumn', database: str) -> str:
-        parts = [column.name, column.data_type]
-
-        if column.length and column.data_type.lower() in ('varchar', 'char'):
-            parts[1] = f"{parts[1]}({column.length})"
-
-        if column.primary_key:
-            parts.append('PRIMARY KEY')
-        if column.not_null:
-            parts.append('NOT NULL')
-        if column.default is not None:
-            parts.append(f"DEFAULT {column.default}")
-
-        return ' '.join(parts)
+        return column.name + _column_suffix(column.data_type, column.length, column.primary_key,
+                                            column.not_null, column.default)
 
     def _build_index_definition(self, table_name: str, index: 'MagiTableIndex') -> str:
         index_type = 'UNIQUE INDEX' if index.unique else 'INDEX'
@@ -29,40 +40,32 @@ class DDLConstruct:
         return f"CREATE {index_type} {index.name} ON {table_name} ({columns})"
 
     def create_table(self, magi_table: MagiTable, database='oracle') -> str:
-        if database.lower() not in self.SUPPORTED_DATABASES:
+        db = database.lower()
+        if db not in self.SUPPORTED_DATABASES:
             raise ValueError(f"Unsupported database: {database}. Supported databases: {self.SUPPORTED_DATABASES}")
 
         ddl = MagiDDL()
         ddl.table = magi_table
+        table_name = magi_table.table_name
 
-        # Build base CREATE TABLE statement
-        ddl_str = ddl.get_ddl_string()
+        # Column definitions and column comments in a single pass
+        column_definitions = []
+        column_comments = []
+        for column in magi_table.columns:
+            column_definitions.append(self._build_column_definition(column, db))
+            if column.comment:
+                column_comments.append(f"COMMENT ON COLUMN {table_name}.{column.name} IS '{column.comment}'")
 
-        # Add column definitions
-        columns = [
-            self._build_column_definition(col, database)
-            for col in magi_table.columns.values()
-        ]
-        ddl_str += f" (\n    {',\n    '.join(columns)}\n)"
+        # Base CREATE TABLE statement with its columns
+        create_statement = ddl.get_ddl_string() + ' (\n    ' + ',\n    '.join(column_definitions) + '\n)'
 
-        # Add table comment if exists
+        # Table comment (same syntax for oracle and postgres)
         if magi_table.table_comment:
-            if database == 'oracle':
-                ddl_str += f"\nCOMMENT ON TABLE {magi_table.table_name} IS '{magi_table.table_comment}'"
-            else:  # postgres
-                ddl_str += f"\nCOMMENT ON TABLE {magi_table.table_name} IS '{magi_table.table_comment}'"
+            create_statement += f"\nCOMMENT ON TABLE {table_name} IS '{magi_table.table_comment}'"
 
-        # Add column comments if they exist
-        for column in magi_table.columns.values():
-            if column.comment:
-                ddl_str += f";\nCOMMENT ON COLUMN {magi_table.table_name}.{column.name} IS '{column.comment}'"
-
-        # Add indexes
-        if magi_table.indexes:
-            index_statements = [
-                self._build_index_definition(magi_table.table_name, idx)
-                for idx in magi_table.indexes.values()
-            ]
-            ddl_str += ';\n' + ';\n'.join(index_statements)
+        index_statements = [
+            self._build_index_definition(table_name, idx)
+            for idx in magi_table.indexes.values()
+        ]
 
-        return ddl_str
+        return ';\n'.join([create_statement, *column_comments, *index_statements])
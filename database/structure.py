@@ -1,6 +1,6 @@
 from dataclasses import dataclass, field
 from abc import ABC, abstractmethod
-from typing import Dict
+from typing import Dict, List
 
 
 class MagiDDL:
@@ -38,7 +38,7 @@ class MagiDDL:
         return ' '.join(ddl_parts)
 
 
-@dataclass
+@dataclass(slots=True)
 class MagiTableColumn:
     name: str
     data_type: str
@@ -55,28 +55,33 @@ class MagiTableColumn:
         return f"name={self.name}, data_type={self.data_type}, length={self.length}, precision={self.precision}, primary_key={self.primary_key}, unique={self.unique}, not_null={self.not_null}, default={self.default}, comment={self.comment}, no={self.no}"
 
 
-@dataclass
+@dataclass(slots=True)
 class MagiTableIndex:
     name: str
     columns: list[str] = field(default_factory=list)
     unique: bool = False
 
 
-@dataclass
+@dataclass(slots=True)
 class MagiTable:
     table_name: str
     table_comment: str or None = None
     table_schema: str or None = None
-    columns: Dict[str, MagiTableColumn] = field(default_factory=dict)
+    # kept in column order (`no`); consumers iterate it as-is
+    columns: List[MagiTableColumn] = field(default_factory=list)
     indexes: Dict[str, MagiTableIndex] = field(default_factory=dict)
 
+    def build_name_index(self) -> Dict[str, MagiTableColumn]:
+        # builds a new dict on each call; build it once before looking up many names
+        return {column.name: column for column in self.columns}
+
     def __str__(self):
         output = []
         output.append(f"table_name={self.table_name}")
         output.append(f"table_comment={self.table_comment}")
         output.append(f"table_schema={self.table_schema}")
         output.append("columns:")
-        for col in self.columns.values():
+        for col in self.columns:
             output.append(f"  {col}")
         output.append("indexes:")
         for idx in self.indexes.values():
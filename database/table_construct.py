@@ -17,6 +17,8 @@ class DefineDataFrameColumns:
     not_null: str = 'not_null'
     default: str = 'default'
     comment: str = 'comment'
+    # column of test values produced by TestDataGenerator
+    generated_value: str = 'generated_value'
 
     @classmethod
     def generate_csv_data(cls) -> pd.DataFrame:
@@ -71,31 +73,47 @@ class TableConstruct(ABC):
 
     # </editor-fold>
 
-    def __extract_columns_to_magi_columns(self) -> Dict[str, MagiTableColumn]:
-        dictionary: Dict[str, MagiTableColumn] = {}
-        for index, (_, row) in enumerate(self.columns_view.iterrows()):
-            iter_column = MagiTableColumn('', '')
-            iter_column.name = row[DefineDataFrameColumns.name]
-            iter_column.data_type = row[DefineDataFrameColumns.data_type]
-            iter_column.length = row[DefineDataFrameColumns.length]
-            iter_column.precision = row[DefineDataFrameColumns.precision]
-            iter_column.primary_key = row[DefineDataFrameColumns.primary_key]
-            iter_column.unique = row[DefineDataFrameColumns.unique]
-            iter_column.not_null = row[DefineDataFrameColumns.not_null]
-            iter_column.default = row[DefineDataFrameColumns.default]
-            iter_column.comment = row[DefineDataFrameColumns.comment]
-            iter_column.no = index + 1
-            dictionary[iter_column.name] = iter_column
-        return dictionary
+    def __extract_columns_to_magi_columns(self) -> List[MagiTableColumn]:
+        # Missing cells become None (as the model expects) rather than NaN
+        view = self.columns_view.astype(object).where(self.columns_view.notna(), None)
+        # Pull whole columns and zip them; iterrows builds a Series per row
+        rows = zip(*(view[column].tolist() for column in (
+            DefineDataFrameColumns.name,
+            DefineDataFrameColumns.data_type,
+            DefineDataFrameColumns.length,
+            DefineDataFrameColumns.precision,
+            DefineDataFrameColumns.primary_key,
+            DefineDataFrameColumns.unique,
+            DefineDataFrameColumns.not_null,
+            DefineDataFrameColumns.default,
+            DefineDataFrameColumns.comment,
+        )))
+        return [
+            MagiTableColumn(
+                name=name,
+                data_type=data_type,
+                length=length,
+                precision=precision,
+                primary_key=primary_key,
+                unique=unique,
+                not_null=not_null,
+                default=default,
+                comment=comment,
+                no=index + 1,
+            )
+            for index, (name, data_type, length, precision, primary_key,
+                        unique, not_null, default, comment) in enumerate(rows)
+        ]
 
     def magi_table_factory(self) -> MagiTable:
         self.read_define()
-        object = MagiTable(self.table_name)
-        object.table_comment = self.table_comment
-        object.table_schema = self.table_schema
-        object.columns = self.__extract_columns_to_magi_columns()
-        object.indexes = self.indexes
-        return object
+        return MagiTable(
+            table_name=self.table_name,
+            table_comment=self.table_comment,
+            table_schema=self.table_schema,
+            columns=self.__extract_columns_to_magi_columns(),
+            indexes=self.indexes,
+        )
 
 #  Usage Example:
 # class DemoTableLConstructImpl(TableConstruct):
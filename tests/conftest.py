@@ -0,0 +1,35 @@
+import importlib.util
+import sys
+import types
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent.parent
+
+# The database modules import each other through the src.magilib package they
+# are shipped in; register the files from this tree under those names.
+_ALIASES = {
+    'src.magilib.database.model.structure': ROOT / 'database' / 'structure.py',
+    'src.magilib.database.table_construct': ROOT / 'database' / 'table_construct.py',
+}
+
+
+def _load(name: str, path: Path) -> types.ModuleType:
+    spec = importlib.util.spec_from_file_location(name, path)
+    module = importlib.util.module_from_spec(spec)
+    sys.modules[name] = module
+    spec.loader.exec_module(module)
+    return module
+
+
+def load_repo_module(name: str, relative_path: str) -> types.ModuleType:
+    """Import a repo file by path (some file names are not importable)"""
+    if name in sys.modules:
+        return sys.modules[name]
+    return _load(name, ROOT / relative_path)
+
+
+for _parent in ('src', 'src.magilib', 'src.magilib.database', 'src.magilib.database.model'):
+    sys.modules.setdefault(_parent, types.ModuleType(_parent))
+for _name, _path in _ALIASES.items():
+    if _name not in sys.modules:
+        _load(_name, _path)
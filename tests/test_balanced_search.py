@@ -0,0 +1,110 @@
+import random
+from itertools import islice
+
+import pytest
+
+from conftest import load_repo_module
+
+balanced = load_repo_module('balanced_search', 'text_process/balanced search.py')
+
+
+def _reference_find(text, left, right, start):
+    # Char-by-char scan: left takes priority over right at the same index
+    i = text.find(left, start)
+    if i < 0:
+        return None
+    depth, j = 0, i
+    while j < len(text):
+        if text.startswith(left, j):
+            depth += 1
+            j += len(left)
+        elif text.startswith(right, j):
+            depth -= 1
+            if depth == 0:
+                return (i, j, text[i + len(left):j])
+            j += len(right)
+        else:
+            j += 1
+    return None
+
+
+def _reference_find_all(text, left, right, start):
+    results = []
+    while True:
+        found = _reference_find(text, left, right, start)
+        if not found:
+            return results
+        results.append(found)
+        start = found[1] + len(right)
+
+
+def test_nested_and_fullwidth_pairs():
+    assert balanced.find_balanced('f(a(b)c)d') == (1, 7, 'a(b)c')
+    assert balanced.find_all_balanced('（一（二））x（三）', '（', '）') == [(0, 5, '一（二）'), (7, 9, '三')]
+
+
+@pytest.mark.parametrize('left, right, text', [
+    ('ab', 'ba', 'abababa'),
+    ('ab', 'ba', 'xabaabbaba'),
+    ('((', '(', '((((a(('),
+    ('((', '(', '(((b(((('),
+])
+def test_overlapping_multi_char_delimiters(left, right, text):
+    for start in range(len(text) + 1):
+        assert balanced.find_balanced(text, left, right, start) == _reference_find(text, left, right, start)
+        assert balanced.find_all_balanced(text, left, right, start) == _reference_find_all(text, left, right, start)
+
+
+def test_identical_delimiters_never_close():
+    assert balanced.find_balanced("'a'b'", "'", "'") is None
+    assert balanced.find_all_balanced('xx a xx', 'xx', 'xx') == []
+
+
+def test_unclosed_groups():
+    assert balanced.find_balanced('((a)') is None
+    assert balanced.find_all_balanced('(a)(b') == [(0, 2, 'a')]
+    assert balanced.find_all_balanced('(a)((b)') == [(0, 2, 'a')]
+
+
+def test_negative_and_out_of_range_start():
+    text = '(a)(b)'
+    assert balanced.find_balanced(text, start=-3) == (3, 5, 'b')
+    assert balanced.find_all_balanced(text, start=-100) == [(0, 2, 'a'), (3, 5, 'b')]
+    assert balanced.find_balanced(text, start=100) is None
+    assert balanced.find_all_balanced(text, start=len(text)) == []
+
+
+def test_iter_balanced_validates_eagerly_and_stops_early():
+    with pytest.raises(ValueError):
+        balanced.iter_balanced('(a)', '', ')')
+
+    text = '(a)(b)' + '(' * 10000
+    matches = balanced.iter_balanced(text)
+    assert list(islice(matches, 2)) == [(0, 2, 'a'), (3, 5, 'b')]
+    assert next(balanced.iter_balanced(text, start=1)) == (3, 5, 'b')
+
+
+def test_random_texts_match_reference_scan():
+    rng = random.Random(7)
+    pairs = [('(', ')'), ('（', '）'), ('ab', 'b'), ('a', 'ab'), ('aa', 'a'),
+             ('[[', ']]'), ('ab', 'ba'), ('a', 'a'), ('xx', 'xx')]
+    for _ in range(5000):
+        left, right = rng.choice(pairs)
+        text = ''.join(rng.choice('ab()（）[]x') for _ in range(rng.randint(0, 30)))
+        start = rng.randint(-3, 6)
+        assert balanced.find_balanced(text, left, right, start) == _reference_find(text, left, right, start)
+        assert list(balanced.iter_balanced(text, left, right, start)) == _reference_find_all(text, left, right, start)
+
+
+def test_jit_scan_matches_single_char_scan():
+    pytest.importorskip('numba')
+    assert balanced.njit is not None
+
+    rng = random.Random(11)
+    for left, right in [('(', ')'), ('（', '）'), ('𝔘', '𝔙')]:
+        text = ''.join(rng.choice(['a', '中', '😀', '𝔘', '𝔙', '(', ')', '（', '）', '\ud800'])
+                       for _ in range(4096))
+        assert len(text) >= balanced._JIT_MIN_LENGTH
+        expected = list(balanced._scan_single(text, left, right, 0))
+        assert list(balanced._scan_jit(text, left, right, 0)) == expected
+        assert balanced.find_all_balanced(text, left, right) == expected
@@ -0,0 +1,79 @@
+import json
+
+import pytest
+
+from conftest import load_repo_module
+
+config = load_repo_module('config', 'commonlib/config.py')
+Config = config.Config
+
+
+class _SlottedBase:
+    __slots__ = ('initialized',)
+
+    def __init__(self):
+        self.initialized = True
+
+
+def test_slots_with_dict_supports_super_init(tmp_path):
+    path = tmp_path / 'settings.json'
+
+    @Config(path)
+    class Settings(_SlottedBase):
+        __slots__ = ('__dict__', 'tag')
+        host = 'localhost'
+
+        def __init__(self):
+            super().__init__()
+            self.tag = 'x'
+
+    first = Settings()
+    assert first.initialized and first.tag == 'x'
+    assert first.is_available and first.error == []
+
+    path.write_text(json.dumps({'host': 'example.org'}), encoding='utf-8')
+    second = Settings()
+    assert second.host == 'example.org'
+    assert second.is_available and second.error == []
+
+
+def test_slots_without_dict_are_rejected_at_decoration(tmp_path):
+    with pytest.raises(TypeError, match='__dict__'):
+        @Config(tmp_path / 'settings.json')
+        class Settings(_SlottedBase):
+            __slots__ = ('tag',)
+
+            def __init__(self):
+                super().__init__()
+                self.tag = 'x'
+
+    with pytest.raises(TypeError, match='__dict__'):
+        @Config(tmp_path / 'settings.json')
+        class Plain:
+            __slots__ = ('tag',)
+            host = 'localhost'
+
+
+def test_slot_descriptors_are_not_config_attributes(tmp_path):
+    @Config(tmp_path / 'settings.json')
+    class Settings(_SlottedBase):
+        __slots__ = ('__dict__', 'tag')
+        host = 'localhost'
+
+    assert Settings._config_attrs == ('host',)
+
+
+@pytest.mark.parametrize('suffix', ['.json', '.yaml'])
+def test_cached_reads_do_not_share_values_with_earlier_instances(tmp_path, suffix):
+    path = tmp_path / f'settings{suffix}'
+    path.write_text(json.dumps({'hosts': ['a']}), encoding='utf-8')
+
+    @Config(path)
+    class Settings:
+        hosts = []
+
+    instances = [Settings() for _ in range(3)]
+    instances[0].hosts.append('cold')
+    instances[1].hosts.append('first hit')
+    assert Settings().hosts == ['a']
+    assert instances[2].hosts == ['a']
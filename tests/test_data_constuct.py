@@ -0,0 +1,84 @@
+import math
+
+import pytest
+
+from conftest import load_repo_module
+
+structure = load_repo_module('src.magilib.database.model.structure', 'database/structure.py')
+data_constuct = load_repo_module('data_constuct', 'database/data_constuct.py')
+
+MagiTable = structure.MagiTable
+MagiTableColumn = structure.MagiTableColumn
+
+
+def _table_with_missing_values():
+    table = MagiTable('t')
+    table.columns.extend([
+        MagiTableColumn('id', 'INTEGER', length=3, no=1),
+        MagiTableColumn('code', 'VARCHAR', length=math.nan, no=2),
+        MagiTableColumn('label', 'CHAR', length=4, default=math.nan, no=3),
+        MagiTableColumn('raw', None, no=4),
+        MagiTableColumn('created', 'DATE', default='SYSDATE', no=5),
+        MagiTableColumn('note', 'TEXT', length=2, default='', no=6),
+        MagiTableColumn('memo', 'VARCHAR', length=6, comment=math.nan, no=7),
+        MagiTableColumn('flag', math.nan, default='NULL', no=8),
+    ])
+    return table
+
+
+def test_generate_inserts_matches_dataframe_path_for_missing_values():
+    table = _table_with_missing_values()
+    generator = data_constuct.TestDataGenerator()
+
+    direct = generator.generate_inserts(table, 't', 's', rows_count=2)
+    assert generator.data_frame is None
+
+    generator.generate_dataframe(table)
+    assert direct == generator.generate_insert_from_dataframe('t', 's', rows_count=2)
+    assert direct[0] == ("INSERT INTO s.t (id, code, label, raw, created, note, memo, flag) "
+                         "VALUES (999, 'N', 'NNNN', NULL, SYSDATE, 'NN', 'NNNNNN', NULL);")
+
+
+def test_generate_inserts_matches_dataframe_path_with_comment_fill():
+    table = _table_with_missing_values()
+    generator = data_constuct.TestDataGenerator(data_constuct.LengthRatio.HALF,
+                                                data_constuct.TextFillMode.COMMENT_PLUS_N)
+
+    direct = generator.generate_inserts(table, 't')
+    generator.generate_dataframe(table)
+    assert direct == generator.generate_insert_from_dataframe('t')
+
+
+def test_saved_csv_keeps_lengths_integral(tmp_path):
+    generator = data_constuct.TestDataGenerator()
+    generator.generate_dataframe(_table_with_missing_values())
+    path = tmp_path / 'columns.csv'
+    generator.save_dataframe_to_csv(str(path))
+
+    rows = path.read_text(encoding='utf-8').splitlines()
+    assert rows[1].startswith('id,INTEGER,3,,')
+    assert rows[2].startswith('code,VARCHAR,,,')
+
+
+@pytest.mark.parametrize('use_arrow', [False, True])
+def test_csv_round_trip_keeps_text_values_verbatim(tmp_path, monkeypatch, use_arrow):
+    if use_arrow:
+        pytest.importorskip('pyarrow')
+    else:
+        monkeypatch.setattr(data_constuct, 'pa', None)
+    table = MagiTable('t')
+    table.columns.extend([
+        MagiTableColumn('id', 'NUMBER', length=20, no=1),
+        MagiTableColumn('code', 'CHAR', length=3, default='007', no=2),
+        MagiTableColumn('flag', 'VARCHAR', length=4, default='TRUE', no=3),
+        MagiTableColumn('raw', None, no=4),
+    ])
+    generator = data_constuct.TestDataGenerator()
+    generator.generate_dataframe(table)
+    expected = generator.generate_insert_from_dataframe('t')
+    path = tmp_path / 'columns.csv'
+    generator.save_dataframe_to_csv(str(path))
+
+    generator.load_dataframe_from_csv(str(path))
+    assert generator.generate_insert_from_dataframe('t') == expected
+    assert str(generator.data_frame['length'].dtype) == 'Int64'
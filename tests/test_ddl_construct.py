@@ -0,0 +1,15 @@
+from conftest import load_repo_module
+
+ddl_construct = load_repo_module('ddl_construct', 'database/ddl_construct.py')
+
+
+def test_column_suffix_cache_keeps_int_and_float_lengths_apart():
+    ddl_construct._column_suffix.cache_clear()
+    assert ddl_construct._column_suffix('VARCHAR', 100.0, False, False, None) == ' VARCHAR(100.0)'
+    assert ddl_construct._column_suffix('VARCHAR', 100, False, False, None) == ' VARCHAR(100)'
+
+
+def test_column_suffix_cache_keeps_int_and_bool_flags_apart():
+    ddl_construct._column_suffix.cache_clear()
+    assert ddl_construct._column_suffix('INTEGER', None, 1, True, 1) == ' INTEGER PRIMARY KEY NOT NULL DEFAULT 1'
+    assert ddl_construct._column_suffix('INTEGER', None, True, True, True) == ' INTEGER PRIMARY KEY NOT NULL DEFAULT True'
@@ -1,4 +1,160 @@
-from typing import List, Optional, Tuple
+from typing import Iterator, List, Optional, Tuple
+
+try:  # optional: JIT-compiled scanner for long texts
+    import numpy as np
+    from numba import njit
+except ImportError:
+    njit = None
+
+# Below this length the encode + dispatch overhead outweighs the JIT loop
+_JIT_MIN_LENGTH = 1024
+
+if njit is not None:
+    @njit(cache=True)
+    def _scan_codes(buf, left, right, start):
+        """Return (i_left, i_right) of the first balanced pair, or (-1, -1)."""
+        depth = 0
+        i = -1
+        for k in range(start, buf.shape[0]):
+            c = buf[k]
+            if c == left:
+                if depth == 0:
+                    i = k
+                depth += 1
+            elif c == right and depth:
+                depth -= 1
+                if depth == 0:
+                    return i, k
+        return -1, -1
+
+
+def _scan_jit(text: str, left: str, right: str,
+              start: int) -> Iterator[Tuple[int, int, str]]:
+    """Numba path of `_scan_single` for long texts.
+
+    The text is viewed as UTF-32 code points so array indices equal string
+    indices (non-ASCII text and fullwidth delimiters work unchanged; lone
+    surrogates are passed through as their own code units).  Encoding is a
+    full pass over `text`, so only callers that scan to the end use this.
+    """
+    buf = np.frombuffer(text.encode("utf-32-le", "surrogatepass"), dtype=np.uint32)
+    L, R = ord(left), ord(right)
+    while True:
+        i, j = _scan_codes(buf, L, R, start)
+        if i < 0:
+            return
+        yield (i, j, text[i + 1 : j])
+        start = j + 1
+
+
+def _scan_single(text: str, left: str, right: str,
+                 start: int) -> Iterator[Tuple[int, int, str]]:
+    """Fast path of `_scan_balanced` for distinct single-char delimiters.
+
+    Delimiters cannot overlap here, so each cursor simply advances past its
+    own hit and no priority bookkeeping is needed.
+    """
+    find = text.find
+    i = find(left, start)
+    while i >= 0:
+        depth = 1
+        nl = find(left, i + 1)
+        nr = find(right, i + 1)
+        while nr >= 0:
+            if 0 <= nl < nr:
+                depth += 1
+                nl = find(left, nl + 1)
+                continue
+            depth -= 1
+            if depth == 0:
+                yield (i, nr, text[i + 1 : nr])
+                break
+            nr = find(right, nr + 1)
+        else:
+            # 扫到底仍未闭合
+            return
+        # 下一个 left 已经找过时直接复用
+        i = nl if nl > nr else find(left, nr + 1)
+
+
+def _scan_balanced(text: str, left: str, right: str, start: int,
+                   jit: bool = False) -> Iterator[Tuple[int, int, str]]:
+    """Yield non-overlapping balanced regions in one forward pass.
+
+    Instead of stepping one character at a time, jump between delimiter
+    positions located with `str.find` (which runs in C); the Python loop
+    only runs once per delimiter.  At a given index `left` takes priority
+    over `right`, and after a delimiter the scan resumes past it, exactly
+    as a char-by-char scan would.
+
+    With `jit`, long texts with single-char delimiters go through the numba
+    scanner when it is available.
+    """
+    L, R = len(left), len(right)
+    if L == R == 1 and left != right:
+        if jit and njit is not None and start >= 0 and len(text) >= _JIT_MIN_LENGTH:
+            yield from _scan_jit(text, left, right, start)
+        else:
+            yield from _scan_single(text, left, right, start)
+        return
+    find = text.find
+
+    # 1) 找到起始 left
+    i = find(left, start)
+    while i >= 0:
+        depth = 1
+        j = i + L
+        # 下一个 left/right 的位置（只在游标越过时重新查找）
+        nl = find(left, j)
+        nr = find(right, j)
+        while nr >= 0:
+            if 0 <= nl <= nr:
+                # left 优先（多字符安全）
+                depth += 1
+                j = nl + L
+                nl = find(left, j)
+                if nr < j:
+                    nr = find(right, j)
+                continue
+            depth -= 1
+            if depth == 0:
+                # nr 是 right 的起始
+                yield (i, nr, text[i + L : nr])
+                break
+            j = nr + R
+            nr = find(right, j)
+            if 0 <= nl < j:
+                nl = find(left, j)
+        else:
+            # 扫到底仍未闭合
+            return
+        # 跳过当前这对（非重叠），继续找下一个 left
+        i = find(left, nr + R)
+
+
+def _check_delimiters(left: str, right: str) -> None:
+    if not left or not right:
+        raise ValueError("left/right must be non-empty strings.")
+
+
+def iter_balanced(text: str, left: str = "(", right: str = ")",
+                  start: int = 0) -> Iterator[Tuple[int, int, str]]:
+    """Lazily yield non-overlapping balanced regions in `text`.
+
+    Same matches as `find_all_balanced`, but produced one at a time, so a
+    caller that stops early does not pay for scanning the rest of the text
+    (this path never hands the whole text to the JIT scanner).
+
+    Yields:
+        (i_left, i_right, inner), as returned by `find_balanced`.
+
+    Raises:
+        ValueError: If `left` or `right` is empty (raised on call, not on
+            first iteration).
+    """
+    _check_delimiters(left, right)
+    return _scan_balanced(text, left, right, start)
+
 
 def find_balanced(text: str, left: str = "(", right: str = ")",
                   start: int = 0) -> Optional[Tuple[int, int, str]]:
@@ -26,55 +182,18 @@ def find_balanced(text: str, left: str = "(", right: str = ")",
         - Overlapping pairs are not produced here; this returns only the first.
         - Works with fullwidth punctuations (e.g., '（', '）').
     """
-    if not left or not right:
-        raise ValueError("left/right must be non-empty strings.")
-    n, L, R = len(text), len(left), len(right)
-
-    # 1) 找到起始 left
-    i = text.find(left, start)
-    if i < 0:
-        return None
-
-    depth = 0
-    j = i
-    while j < n:
-        # 优先检查 left/right 子串匹配（多字符安全）
-        if text.startswith(left, j):
-            depth += 1
-            j += L
-            continue
-        if text.startswith(right, j):
-            depth -= 1
-            if depth == 0:
-                # j 是 right 的起始
-                inner = text[i + L : j]
-                return (i, j, inner)
-            j += R
-            continue
-        # 普通字符，前进一步
-        j += 1
-
-    # 扫到底仍未闭合
-    return None
+    return next(iter_balanced(text, left, right, start), None)
 
 
 def find_all_balanced(text: str, left: str = "(", right: str = ")",
                       start: int = 0) -> List[Tuple[int, int, str]]:
     """Find all non-overlapping balanced regions in `text`.
 
-    Iteratively calls `find_balanced` and advances beyond each match.
+    Scans the text once, resuming after each match.  Long texts with
+    single-char delimiters use the numba scanner when it is installed.
 
     Returns:
         A list of (i_left, i_right, inner).
     """
-    results: List[Tuple[int, int, str]] = []
-    pos = start
-    while True:
-        found = find_balanced(text, left, right, pos)
-        if not found:
-            break
-        i_left, i_right, inner = found
-        results.append(found)
-        # 跳过当前这对（非重叠）
-        pos = i_right + len(right)
-    return results
+    _check_delimiters(left, right)
+    return list(_scan_balanced(text, left, right, start, jit=True))
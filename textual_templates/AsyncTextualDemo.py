@@ -9,17 +9,56 @@ This application demonstrates how to handle long-running business logic in Textu
 """
 
 import asyncio
+import threading
 import time
-from datetime import datetime
-from typing import Callable, Optional
+from collections import deque
+from contextlib import contextmanager
+from typing import Callable, Deque, Optional
 from textual.app import App, ComposeResult
-from textual.containers import Container, Horizontal, Vertical
+from textual.containers import Grid, Horizontal, Vertical
 from textual.widgets import Header, Footer, Button, TextArea, Static, ProgressBar
 from textual.worker import Worker, get_current_worker
-from textual import log
+from textual import log, work
 import random
 
 
+# Initial log panel text, kept short so the first document parse is cheap
+_LOG_AREA_INITIAL = (
+    "=== Business Processing System Ready ===\n"
+    "Click \"Start Processing\" button to begin\n"
+    "Ready to begin..."
+)
+
+
+@contextmanager
+def _forbid_blocking_sleep():
+    """
+    Make time.sleep() raise when called on the event loop thread
+
+    A blocking sleep inside a coroutine freezes the whole asyncio loop (and
+    the UI with it). While the context is active, time.sleep() called from
+    the thread that entered it raises RuntimeError; other threads are
+    unaffected. Only active in debug runs (skipped under python -O).
+    """
+    if not __debug__:
+        yield
+        return
+
+    original_sleep = time.sleep
+    loop_thread = threading.get_ident()
+
+    def guarded_sleep(seconds: float) -> None:
+        if threading.get_ident() == loop_thread:
+            raise RuntimeError("time.sleep() blocks the event loop, use 'await asyncio.sleep()' instead")
+        original_sleep(seconds)
+
+    time.sleep = guarded_sleep
+    try:
+        yield
+    finally:
+        time.sleep = original_sleep
+
+
 class BusinessProcessor:
     """
     Business Processor Class
@@ -36,6 +75,15 @@ class BusinessProcessor:
         self.progress_callback: Optional[Callable[[int], None]] = None
         self.total_tasks = 10
         self.current_task = 0
+        # Cached "HH:MM:SS" prefix for log timestamps and the second it belongs to
+        self._ts_second = -1
+        self._ts_prefix = ""
+        # Set by stop_processing(); wakes any pending _sleep_or_stop() at once
+        self._stop = asyncio.Event()
+        # Pending log messages, delivered to log_callback in batches by flush_logs()
+        self._log_queue: Deque[str] = deque()
+        # Set while messages are queued; wakes drain_logs()
+        self._log_ready = asyncio.Event()
 
     def set_log_callback(self, callback: Callable[[str], None]) -> None:
         """
@@ -57,16 +105,59 @@ class BusinessProcessor:
 
     def _log(self, message: str) -> None:
         """
-        Internal logging method that sends logs to UI via callback
+        Internal logging method that queues logs for the UI callback
+
+        Messages are delivered by drain_logs() (or an explicit flush_logs())
+        in batches, so a burst of log lines costs one UI update instead of
+        one per line.
 
         Args:
             message: Log message
         """
-        timestamp = datetime.now().strftime("%H:%M:%S.%f")[:-3]
-        full_message = f"[{timestamp}] {message}"
+        # Only format HH:MM:SS when the second changes; add milliseconds numerically
+        now = time.time()
+        second = int(now)
+        if second != self._ts_second:
+            self._ts_second = second
+            self._ts_prefix = time.strftime("%H:%M:%S", time.localtime(second))
+        full_message = f"[{self._ts_prefix}.{int((now - second) * 1000):03d}] {message}"
+
+        self._log_queue.append(full_message)
+        self._log_ready.set()
+
+    def flush_logs(self, max_batch: int = 64) -> None:
+        """
+        Deliver every queued log message to the log callback right away
+
+        Callers that log directly to the UI flush first, so their lines land
+        after the business logs queued before them.
+
+        Args:
+            max_batch: Maximum number of messages per callback call
+        """
+        queue = self._log_queue
+        self._log_ready.clear()
+        while queue:
+            messages = [queue.popleft() for _ in range(min(max_batch, len(queue)))]
+            if self.log_callback:
+                self.log_callback("\n".join(messages))
+
+    async def drain_logs(self, max_batch: int = 64) -> None:
+        """
+        Deliver queued log messages to the log callback until cancelled
+
+        Waits for a message, yields once so that messages logged in the same
+        tick can accumulate, then flushes them in batches of up to
+        `max_batch` newline-joined messages. Nothing is held across the
+        await, so a flush_logs() from elsewhere keeps the order intact.
 
-        if self.log_callback:
-            self.log_callback(full_message)
+        Args:
+            max_batch: Maximum number of messages per callback call
+        """
+        while True:
+            await self._log_ready.wait()
+            await asyncio.sleep(0)
+            self.flush_logs(max_batch)
 
     def _update_progress(self, current: int) -> None:
         """
@@ -79,6 +170,22 @@ class BusinessProcessor:
         if self.progress_callback:
             self.progress_callback(progress)
 
+    async def _sleep_or_stop(self, seconds: float) -> None:
+        """
+        Sleep for the given time, returning early if a stop is requested
+
+        Args:
+            seconds: Time to sleep
+
+        Raises:
+            asyncio.CancelledError: If stop_processing() was called
+        """
+        try:
+            await asyncio.wait_for(self._stop.wait(), timeout=seconds)
+        except asyncio.TimeoutError:
+            return
+        raise asyncio.CancelledError
+
     async def start_processing(self) -> None:
         """
         Start business processing flow
@@ -88,99 +195,90 @@ class BusinessProcessor:
         2. Batch task processing  
         3. Result summarization
 
-        Uses asyncio.sleep to simulate IO operations while keeping UI responsive
+        Uses asyncio.sleep to simulate IO operations while keeping UI responsive;
+        a stop request interrupts whichever sleep is pending
         """
         if self.is_running:
             self._log("❌ Processing already running, please stop current task first")
             return
 
-        try:
-            self.is_running = True
-            self.current_task = 0
-
-            self._log("🚀 Starting business processing flow")
-
-            # Stage 1: Initialize and preprocess
-            self._log("📋 Stage 1: Data preprocessing...")
-            await asyncio.sleep(1.5)  # Simulate data loading time
-
-            if not self.is_running:
-                self._log("⏸️  Processing interrupted by user")
-                return
-
-            self._log("✅ Data preprocessing completed")
-
-            # Stage 2: Batch task processing
-            self._log(f"⚙️  Stage 2: Processing {self.total_tasks} tasks...")
+        # Guard against blocking sleeps sneaking into the async flow
+        with _forbid_blocking_sleep():
+            try:
+                self.is_running = True
+                self.current_task = 0
+                self._stop.clear()
 
-            for i in range(self.total_tasks):
-                if not self.is_running:
-                    self._log("⏸️  Processing interrupted by user")
-                    return
+                self._log("🚀 Starting business processing flow")
 
-                # Simulate processing time for each task (random 0.5-2 seconds)
-                task_duration = random.uniform(0.5, 2.0)
-                task_name = f"Task-{i + 1:02d}"
+                # Stage 1: Initialize and preprocess
+                self._log("📋 Stage 1: Data preprocessing...")
+                await self._sleep_or_stop(1.5)  # Simulate data loading time
 
-                self._log(f"🔄 Processing {task_name} (estimated time: {task_duration:.1f}s)")
+                self._log("✅ Data preprocessing completed")
 
-                # Simulate IO intensive operation
-                await asyncio.sleep(task_duration)
+                # Stage 2: Batch task processing
+                self._log(f"⚙️  Stage 2: Processing {self.total_tasks} tasks...")
 
-                # Simulate occasional errors
-                if random.random() < 0.1:  # 10% chance of warning
-                    self._log(f"⚠️  Warning while processing {task_name}, but continuing")
-                else:
-                    self._log(f"✅ {task_name} completed")
+                for i in range(self.total_tasks):
+                    # Simulate processing time for each task (random 0.5-2 seconds)
+                    task_duration = random.uniform(0.5, 2.0)
+                    task_name = f"Task-{i + 1:02d}"
 
-                self.current_task = i + 1
-                self._update_progress(self.current_task)
+                    self._log(f"🔄 Processing {task_name} (estimated time: {task_duration:.1f}s)")
 
-                # Give UI a chance to update
-                await asyncio.sleep(0.1)
+                    # Simulate IO intensive operation
+                    await self._sleep_or_stop(task_duration)
 
-            if not self.is_running:
-                self._log("⏸️  Processing interrupted by user")
-                return
+                    # Simulate occasional errors
+                    if random.random() < 0.1:  # 10% chance of warning
+                        self._log(f"⚠️  Warning while processing {task_name}, but continuing")
+                    else:
+                        self._log(f"✅ {task_name} completed")
 
-            # Stage 3: Result summarization  
-            self._log("📊 Stage 3: Summarizing results...")
-            await asyncio.sleep(1.0)  # Simulate summary time
+                    self.current_task = i + 1
+                    self._update_progress(self.current_task)
 
-            if not self.is_running:
-                self._log("⏸️  Processing interrupted by user")
-                return
+                # Stage 3: Result summarization  
+                self._log("📊 Stage 3: Summarizing results...")
+                await self._sleep_or_stop(1.0)  # Simulate summary time
 
-            # Generate processing report
-            success_rate = random.uniform(85, 98)
-            total_time = sum(random.uniform(0.5, 2.0) for _ in range(self.total_tasks)) + 3.5
+                # Generate processing report
+                success_rate = random.uniform(85, 98)
+                # Sum of total_tasks uniform(0.5, 2.0) draws, sampled once via its normal approximation
+                total_time = random.gauss(self.total_tasks * 1.25, (self.total_tasks * 1.5 ** 2 / 12) ** 0.5) + 3.5
 
-            self._log("=" * 50)
-            self._log("📋 Processing Complete Report:")
-            self._log(f"   • Total tasks: {self.total_tasks}")
-            self._log(f"   • Success rate: {success_rate:.1f}%")
-            self._log(f"   • Total time: {total_time:.1f} seconds")
-            self._log(f"   • Average time per task: {total_time / self.total_tasks:.2f} seconds")
-            self._log("=" * 50)
-            self._log("🎉 All processing completed successfully!")
+                self._log("=" * 50)
+                self._log("📋 Processing Complete Report:")
+                self._log(f"   • Total tasks: {self.total_tasks}")
+                self._log(f"   • Success rate: {success_rate:.1f}%")
+                self._log(f"   • Total time: {total_time:.1f} seconds")
+                self._log(f"   • Average time per task: {total_time / self.total_tasks:.2f} seconds")
+                self._log("=" * 50)
+                self._log("🎉 All processing completed successfully!")
 
-        except asyncio.CancelledError:
-            self._log("❌ Processing forcefully cancelled")
-        except Exception as e:
-            self._log(f"💥 Processing exception occurred: {str(e)}")
-        finally:
-            self.is_running = False
-            self._update_progress(0)  # Reset progress bar
+            except asyncio.CancelledError:
+                if self._stop.is_set():
+                    self._log("⏸️  Processing interrupted by user")
+                else:
+                    self._log("❌ Processing forcefully cancelled")
+            except Exception as e:
+                self._log(f"💥 Processing exception occurred: {str(e)}")
+            finally:
+                self.is_running = False
+                self._update_progress(0)  # Reset progress bar
 
     def stop_processing(self) -> None:
         """
         Stop business processing
 
-        Sets stop flag that business loop checks to gracefully exit
+        Sets the stop event, which wakes the pending sleep so the business
+        flow exits immediately
         """
         if self.is_running:
             self._log("🛑 Received stop signal, gracefully exiting...")
             self.is_running = False
+            self._stop.set()
         else:
             self._log("ℹ️  No processing currently running")
 
@@ -196,30 +294,17 @@ class AsyncBusinessApp(App):
     - Non-blocking UI interaction
     """
 
+    # Oldest log lines are dropped from the TextArea beyond this many
+    MAX_LOG_LINES = 2000
+
     CSS = """
-    .main-container {
+    #root {
+        grid-size: 1;
+        grid-rows: auto 1fr auto auto auto auto;
         height: 100%;
         margin: 1;
     }
     
-    .log-container {
-        border: solid $accent;
-        padding: 1;
-        margin-bottom: 1;
-        height: 50%;
-        
-    }
-    
-    .controls-container {
-        border: solid $primary;
-        padding: 1;
-        height: 50%;
-    }
-    
-    .progress-container {
-        margin: 1 0;
-    }
-    
     .status-text {
         text-align: center;
         margin: 1 0;
@@ -231,8 +316,8 @@ class AsyncBusinessApp(App):
     }
     
     #log-area {
-        height: 60%;
         min-height: 12;
+        border: solid $accent;
         background: $surface;
     }
     
@@ -254,7 +339,11 @@ class AsyncBusinessApp(App):
     def __init__(self):
         super().__init__()
         self.business_processor = BusinessProcessor()
-        self.current_worker: Optional[Worker] = None
+        # Last progress value/label shown (matches the freshly composed widgets)
+        self._last_progress = 0
+        self._progress_text = "Progress:"
+        # Set while a scroll to the log end is scheduled for after the next refresh
+        self._scroll_pending = False
 
         # Set up business processor callbacks
         self.business_processor.set_log_callback(self.add_log)
@@ -265,59 +354,45 @@ class AsyncBusinessApp(App):
 
         yield Header(show_clock=True)
 
-        with Container(classes="main-container"):
-            # Log display area - takes more space
-            with Container(classes="log-container"):
-                yield Static("📋 Processing Log", classes="status-text")
-                yield TextArea(
-                    "=== Business Processing System Ready ===\n"
-                    "Click \"Start Processing\" button to begin\n"
-                    "Logs will display here in real-time...\n"
-                    "\n"
-                    "💡 Tips:\n"
-                    "- Processing simulates real IO operations\n"
-                    "- Each task takes 0.5-2 seconds\n"
-                    "- Total of 10 tasks to process\n"
-                    "- Can stop running tasks at any time\n"
-                    "- UI remains responsive\n"
-                    "\n"
-                    "Ready to begin...",
-                    read_only=True,
-                    show_line_numbers=True,
-                    id="log-area"
+        # One grid lays out everything: log title, log area, panel title,
+        # progress label, progress bar and the button row
+        with Grid(id="root"):
+            yield Static("📋 Processing Log", classes="status-text")
+            yield TextArea(_LOG_AREA_INITIAL, read_only=True, show_line_numbers=False, id="log-area")
+
+            yield Static("🎮 Control Panel", classes="status-text")
+            yield Static("Progress:", id="progress-label")
+            yield ProgressBar(total=100, show_eta=False, id="progress-bar")
+
+            # Button group
+            with Horizontal(classes="button-group"):
+                yield Button(
+                    "🚀 Start Processing",
+                    variant="success",
+                    id="start-button"
+                )
+                yield Button(
+                    "🛑 Stop Processing",
+                    variant="error",
+                    id="stop-button"
+                )
+                yield Button(
+                    "🗑️  Clear Log",
+                    variant="warning",
+                    id="clear-button"
                 )
-
-            # Control panel - takes less space
-            with Container(classes="controls-container"):
-                yield Static("🎮 Control Panel", classes="status-text")
-
-                # Progress bar container
-                with Container(classes="progress-container"):
-                    yield Static("Progress:", id="progress-label")
-                    yield ProgressBar(total=100, show_eta=False, id="progress-bar")
-
-                # Button group
-                with Horizontal(classes="button-group"):
-                    yield Button(
-                        "🚀 Start Processing",
-                        variant="success",
-                        id="start-button"
-                    )
-                    yield Button(
-                        "🛑 Stop Processing",
-                        variant="error",
-                        id="stop-button"
-                    )
-                    yield Button(
-                        "🗑️  Clear Log",
-                        variant="warning",
-                        id="clear-button"
-                    )
 
         yield Footer()
 
     def on_mount(self) -> None:
         """Initialize on application startup"""
+        # Look the widgets up once; log and progress updates reuse these references
+        self._log_area = self.query_one("#log-area", TextArea)
+        self._progress_bar = self.query_one("#progress-bar", ProgressBar)
+        self._progress_label = self.query_one("#progress-label", Static)
+        self._start_button = self.query_one("#start-button", Button)
+        self._stop_button = self.query_one("#stop-button", Button)
+
         self.add_log("🔧 System initialization complete")
         self.add_log("💡 Tip: Processing simulates IO operations and may take time")
         self.add_log("⚡ UI remains responsive during processing, can stop anytime")
@@ -326,6 +401,15 @@ class AsyncBusinessApp(App):
         # Set initial button states
         self.update_button_states(False)
 
+        # Single consumer that applies business logs to the TextArea in batches;
+        # as a worker, Textual cancels it when the app shuts down
+        self.run_worker(
+            self.business_processor.drain_logs(),
+            group="logs",
+            description="Log Drain",
+            exit_on_error=False,
+        )
+
     def add_log(self, message: str) -> None:
         """
         Add log to TextArea
@@ -336,20 +420,33 @@ class AsyncBusinessApp(App):
             message: Log message to add
         """
         try:
-            log_area = self.query_one("#log-area", TextArea)
+            log_area = self._log_area
+
+            # Append new log at the end (only the new text is inserted,
+            # the existing document is not copied or re-parsed)
+            log_area.insert(message + "\n", location=log_area.document.end)
 
-            # Append new log at the end 
-            current_text = log_area.text
-            new_text = current_text + message + "\n"
-            log_area.load_text(new_text)
+            # Keep the document bounded: drop the oldest lines beyond the window
+            # (the text ends with a newline, so the last document line is empty)
+            overflow = log_area.document.line_count - 1 - self.MAX_LOG_LINES
+            if overflow > 0:
+                log_area.delete((0, 0), (overflow, 0))
 
-            # Auto-scroll to bottom to show latest logs
-            log_area.scroll_end()
+            # Auto-scroll to bottom to show latest logs; a burst of logs
+            # within one frame shares a single scroll
+            if not self._scroll_pending:
+                self._scroll_pending = True
+                self.call_after_refresh(self._scroll_log_to_end)
 
         except Exception as e:
             # Log to app log if UI update fails
             log(f"Failed to update log UI: {e}")
 
+    def _scroll_log_to_end(self) -> None:
+        """Scroll the log area to the bottom (scheduled by add_log)"""
+        self._scroll_pending = False
+        self._log_area.scroll_end(animate=False)
+
     def update_progress(self, progress: int) -> None:
         """
         Update progress bar
@@ -357,16 +454,20 @@ class AsyncBusinessApp(App):
         Args:
             progress: Progress percentage (0-100)
         """
+        # Skip no-op updates so unchanged values don't trigger a refresh
+        if progress == self._last_progress:
+            return
+        self._last_progress = progress
+
         try:
-            progress_bar = self.query_one("#progress-bar", ProgressBar)
+            progress_bar = self._progress_bar
             progress_bar.progress = progress
 
-            # Update progress label
-            progress_label = self.query_one("#progress-label", Static)
-            if progress > 0:
-                progress_label.update(f"Progress: {progress}%")
-            else:
-                progress_label.update("Progress:")
+            # Update progress label (only when the text actually changes)
+            progress_text = f"Progress: {progress}%" if progress > 0 else "Progress:"
+            if progress_text != self._progress_text:
+                self._progress_text = progress_text
+                self._progress_label.update(progress_text)
 
         except Exception as e:
             log(f"Failed to update progress UI: {e}")
@@ -379,8 +480,8 @@ class AsyncBusinessApp(App):
             is_running: Whether processing is running
         """
         try:
-            start_button = self.query_one("#start-button", Button)
-            stop_button = self.query_one("#stop-button", Button)
+            start_button = self._start_button
+            stop_button = self._stop_button
 
             # Disable start button and enable stop button while running
             start_button.disabled = is_running
@@ -397,6 +498,11 @@ class AsyncBusinessApp(App):
         except Exception as e:
             log(f"Failed to update button states: {e}")
 
+    @work(exclusive=True, group="business", description="Business Processing")
+    async def _run_processing(self) -> None:
+        """Run the business flow as a worker (only one processor at a time)"""
+        await self.business_processor.start_processing()
+
     async def on_button_pressed(self, event: Button.Pressed) -> None:
         """Handle button click events"""
 
@@ -405,50 +511,50 @@ class AsyncBusinessApp(App):
         if button_id == "start-button":
             # Start processing
             if not self.business_processor.is_running:
+                self.business_processor.flush_logs()
                 self.add_log("👤 User clicked start processing")
                 self.update_button_states(True)
 
-                # Use Textual Worker to run processing in background
+                # Run processing as a Textual Worker in the background
                 # Worker ensures long running tasks don't block UI
-                self.current_worker = self.run_worker(
-                    self.business_processor.start_processing(),
-                    exclusive=True,  # Only run one processor at a time
-                    description="Business Processing"
-                )
+                self._run_processing()
 
         elif button_id == "stop-button":
             # Stop processing
             if self.business_processor.is_running:
+                self.business_processor.flush_logs()
                 self.add_log("👤 User clicked stop processing")
                 self.business_processor.stop_processing()
 
-                # Try to cancel active worker if exists
-                if self.current_worker and not self.current_worker.is_finished:
-                    self.current_worker.cancel()
+                # Cancel the active worker if one exists
+                self.workers.cancel_group(self, "business")
 
         elif button_id == "clear-button":
             # Clear log
             try:
-                log_area = self.query_one("#log-area", TextArea)
-                log_area.load_text("=== Log Cleared ===\nReady for new logs...\n")
+                # Pending business logs belong to the text being cleared
+                self.business_processor.flush_logs()
+                log_area = self._log_area
+                log_area.clear()
+                log_area.insert("=== Log Cleared ===\nReady for new logs...\n")
                 self.add_log("👤 User cleared log")
             except Exception as e:
                 log(f"Failed to clear log: {e}")
 
     def on_worker_state_changed(self, event: Worker.StateChanged) -> None:
         """Called when Worker state changes"""
-        if event.worker.is_finished:
+        if event.worker.group == "business" and event.worker.is_finished:
+            # The worker's final report may still be queued; show it first
+            self.business_processor.flush_logs()
             self.add_log("🔧 Processing Worker completed")
             self.update_button_states(False)
-            self.current_worker = None
 
     def on_unmount(self) -> None:
         """Cleanup when application closes"""
         if self.business_processor.is_running:
             self.business_processor.stop_processing()
 
-        if self.current_worker and not self.current_worker.is_finished:
-            self.current_worker.cancel()
+        self.workers.cancel_group(self, "business")
 
 
 if __name__ == "__main__":
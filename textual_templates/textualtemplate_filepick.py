@@ -2,29 +2,112 @@ import os
 from pathlib import Path
 from textual.app import App, ComposeResult
 from textual.containers import Container, Horizontal
-from textual.widgets import Header, DirectoryTree, Button, Static
+from textual import on
+from textual.widgets import Header, DirectoryTree, Button, Static, Tree
+from textual.widgets.directory_tree import DirEntry
 from textual.screen import Screen
 from textual.message import Message
-from textual.widgets.tree import TreeNode
+from textual.widgets.tree import TreeNode, UnknownNodeID
 from textual.notifications import Notification
+from textual.worker import Worker
+from typing import Iterable, Iterator
+
+
+class ScandirDirectoryTree(DirectoryTree):
+    """DirectoryTree that lists folders with os.scandir and adds children in batches"""
+    BATCH_SIZE = 64
+
+    def __init__(self, *args, **kwargs) -> None:
+        super().__init__(*args, **kwargs)
+        # is_dir answers taken from the DirEntry, filled in the loader thread
+        self._is_dir_cache: dict[Path, bool] = {}
+        # Node id -> children still to add, while a first expansion is being batched
+        self._pending_children: dict[int, list[Path]] = {}
+        # Folders populated before; reloading them must add all children at once
+        self._populated_paths: set[Path] = set()
+
+    def _directory_content(self, location: Path, worker: Worker) -> Iterator[Path]:
+        try:
+            with os.scandir(location) as entries:
+                for entry in entries:
+                    if worker.is_cancelled:
+                        break
+                    path = location / entry.name
+                    try:
+                        self._is_dir_cache[path] = entry.is_dir()
+                    except OSError:
+                        self._is_dir_cache[path] = False
+                    yield path
+        except OSError:
+            pass
+
+    def _safe_is_dir(self, path: Path) -> bool:
+        is_dir = self._is_dir_cache.get(path)
+        if is_dir is None:
+            return super()._safe_is_dir(path)
+        return is_dir
+
+    def _populate_node(self, node: TreeNode, content: Iterable[Path]) -> None:
+        node.remove_children()
+        paths = list(content)
+        self._pending_children.pop(node.id, None)
+
+        # reload() reopens expanded folders from node.children right after this
+        # returns, so only a folder's first expansion is spread over refreshes
+        path = node.data.path
+        if path in self._populated_paths or len(paths) <= self.BATCH_SIZE:
+            self._add_children(node, paths)
+        else:
+            self._pending_children[node.id] = paths
+            self._add_batch(node, paths, 0)
+        self._populated_paths.add(path)
+        node.expand()
+
+    def _add_children(self, node: TreeNode, paths: list[Path]) -> None:
+        for path in paths:
+            node.add(path.name, data=DirEntry(path), allow_expand=self._safe_is_dir(path))
+            self._is_dir_cache.pop(path, None)
+
+    def _add_batch(self, node: TreeNode, paths: list[Path], start: int) -> None:
+        # Stop once the node was repopulated, collapsed or removed by a reload
+        if self._pending_children.get(node.id) is not paths:
+            return
+        try:
+            self.get_node_by_id(node.id)
+        except UnknownNodeID:
+            del self._pending_children[node.id]
+            return
+
+        end = start + self.BATCH_SIZE
+        self._add_children(node, paths[start:end])
+        if end < len(paths):
+            self.call_after_refresh(self._add_batch, node, paths, end)
+        else:
+            del self._pending_children[node.id]
+
+    @on(Tree.NodeCollapsed)
+    def _cancel_pending_batches(self, event: Tree.NodeCollapsed) -> None:
+        if self._pending_children.pop(event.node.id, None) is not None:
+            # Half-filled folder: list it again on the next expansion
+            event.node.data.loaded = False
 
 
 class FolderBrowserScreen(Screen):
     BINDINGS = [("escape", "pop_screen", "Back")]
+    _FALLBACK_ROOT = 'C:\\'
 
-    def __init__(self, init_root: str = Path.cwd(), is_folder=False, is_file=False) -> None:
+    def __init__(self, init_root: str | None = None, is_folder=False, is_file=False) -> None:
         super().__init__()
         self.selected_path = None
-        if os.path.isdir(init_root):
-            self.init_root = init_root
-        else:
-            self.init_root = r'C:\\'
+        # Resolve the cwd per instance, a default argument would freeze it at import time
+        root = init_root or str(Path.cwd())
+        self.init_root = root if Path(root).is_dir() else self._FALLBACK_ROOT
 
 
     def compose(self) -> ComposeResult:
         yield Header()
         self.title = "Select Folder"
-        yield DirectoryTree(self.init_root, id='directory-tree')
+        yield ScandirDirectoryTree(self.init_root, id='directory-tree')
         with Horizontal():
             yield Button("Confirm", id="confirm")
             yield Button("Back", id="back")
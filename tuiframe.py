@@ -1,10 +1,10 @@
+from textual import work
 from textual.app import App, ComposeResult
 from textual.containers import Container, Horizontal
 from textual.widgets import Button, TextArea, Footer, Static
 from textual.binding import Binding
-import threading
+import asyncio
 import time
-from datetime import datetime
 
 class LogDisplay(TextArea):
 “”“自定义日志显示组件”””
@@ -13,15 +13,23 @@ super().**init**(read_only=True)
 self.show_line_numbers = False
 
 ```
+MAX_LINES = 2000
+
 def add_log(self, message: str):
     """添加日志消息"""
-    current_text = self.text
-    if current_text:
-        self.text = f"{current_text}\n{message}"
-    else:
-        self.text = message
+    # 只在末尾插入新消息，不复制/重新解析整个文本
+    end = self.document.end
+    self.insert(f"\n{message}" if end != (0, 0) else message, location=end)
+    # 只保留最近的日志行，超出后删除最早的行
+    overflow = self.document.line_count - self.MAX_LINES
+    if overflow > 0:
+        self.delete((0, 0), (overflow, 0))
     # 滚动到底部
-    self.scroll_end()
+    self.scroll_end(animate=False)
+
+def clear_log(self):
+    """清空日志"""
+    self.clear()
 ```
 
 class StatusBar(Static):
@@ -77,6 +85,10 @@ BINDINGS = [
     Binding("q", "quit", "退出", show=True),
 ]
 
+# 同一秒内的日志复用已格式化的时间戳
+_ts_sec = -1
+_ts_str = ""
+
 def compose(self) -> ComposeResult:
     """构建UI布局"""
     # 顶部按钮组
@@ -101,50 +113,55 @@ def on_mount(self):
     self.update_status("就绪")
 
 def add_log(self, message: str):
-    """线程安全的日志添加函数"""
-    timestamp = datetime.now().strftime("%H:%M:%S")
-    log_message = f"[{timestamp}] {message}"
-    self.call_from_thread(self.log_display.add_log, log_message)
+    """日志添加函数（任务在事件循环中运行，直接更新UI）"""
+    sec = int(time.time())
+    if sec != self._ts_sec:
+        self._ts_sec = sec
+        self._ts_str = time.strftime("[%H:%M:%S] ", time.localtime(sec))
+    self.log_display.add_log(self._ts_str + message)
 
 def update_status(self, status: str):
-    """线程安全的状态更新函数"""
-    self.call_from_thread(self.status_bar.update_status, f"状态: {status}")
+    """状态更新函数"""
+    self.status_bar.update_status(f"状态: {status}")
 
-def task_worker_1(self):
-    """按钮1的工作线程"""
+@work(exclusive=False)
+async def task_worker_1(self):
+    """按钮1的异步任务"""
     self.update_status("正在执行任务 1...")
     self.add_log("任务 1 开始执行")
     
     # 模拟耗时操作
     for i in range(3):
-        time.sleep(1)
+        await asyncio.sleep(1)
         self.add_log(f"任务 1 - 步骤 {i+1}/3")
     
     self.add_log("任务 1 完成")
     self.update_status("就绪")
 
-def task_worker_2(self):
-    """按钮2的工作线程"""
+@work(exclusive=False)
+async def task_worker_2(self):
+    """按钮2的异步任务"""
     self.update_status("正在执行任务 2...")
     self.add_log("任务 2 开始执行")
     
     # 模拟耗时操作
     for i in range(5):
-        time.sleep(0.5)
+        await asyncio.sleep(0.5)
         self.add_log(f"任务 2 - 处理中 {i+1}/5")
     
     self.add_log("任务 2 完成")
     self.update_status("就绪")
 
-def task_worker_3(self):
-    """按钮3的工作线程"""
+@work(exclusive=False)
+async def task_worker_3(self):
+    """按钮3的异步任务"""
     self.update_status("正在执行任务 3...")
     self.add_log("任务 3 开始执行")
     
     # 模拟耗时操作
-    time.sleep(2)
+    await asyncio.sleep(2)
     self.add_log("任务 3 - 数据处理中...")
-    time.sleep(1)
+    await asyncio.sleep(1)
     self.add_log("任务 3 - 完成数据处理")
     
     self.add_log("任务 3 完成")
@@ -155,22 +172,19 @@ def on_button_pressed(self, event: Button.Pressed) -> None:
     button_id = event.button.id
     
     if button_id == "btn1":
-        # 启动线程执行任务1
-        thread = threading.Thread(target=self.task_worker_1, daemon=True)
-        thread.start()
+        # 启动异步任务1
+        self.task_worker_1()
         
     elif button_id == "btn2":
-        # 启动线程执行任务2
-        thread = threading.Thread(target=self.task_worker_2, daemon=True)
-        thread.start()
+        # 启动异步任务2
+        self.task_worker_2()
         
     elif button_id == "btn3":
-        # 启动线程执行任务3
-        thread = threading.Thread(target=self.task_worker_3, daemon=True)
-        thread.start()
+        # 启动异步任务3
+        self.task_worker_3()
         
     elif button_id == "btn_clear":
-        self.log_display.text = ""
+        self.log_display.clear_log()
         self.add_log("日志已清空")
         self.update_status("日志已清空")
 ```